@@ -15,6 +15,7 @@ console = Console()
 
 __all__ = ['processor', 'common', 'analyzer', 'gui', 'core']
 from highlighter import processor, common, analyzer, gui, core
+from highlighter.core.exceptions import FileSystemError
 
 DEFAULT_TEMP_DIR = tempfile.TemporaryDirectory()
 
@@ -32,7 +33,6 @@ def reference(
     
     if not video_as_path.exists():
         logger.error(f'file does not exist: {path_to_video}')
-        from highlighter.core.exceptions import FileSystemError
         raise FileSystemError(
             f"Video file does not exist: {path_to_video}",
             path=str(path_to_video),
@@ -130,7 +130,6 @@ def batch(
     try:
         video_files = glob.glob(videos_pattern)
     except (OSError, PermissionError) as e:
-        from highlighter.core.exceptions import FileSystemError
         raise FileSystemError(
             f"Cannot access files matching pattern: {videos_pattern}",
             path=videos_pattern,
@@ -144,7 +143,6 @@ def batch(
     
     if not video_files:
         console.print(f"[red]No video files found matching pattern: {videos_pattern}[/red]")
-        from highlighter.core.exceptions import FileSystemError
         raise FileSystemError(
             f"No video files found matching pattern: {videos_pattern}",
             path=videos_pattern,
@@ -282,7 +280,6 @@ def analyze(
             else:
                 files_in_video_path = []
         except (OSError, PermissionError) as e:
-            from highlighter.core.exceptions import FileSystemError
             raise FileSystemError(
                 f"Cannot access directory: {video_as_path.parent}",
                 path=str(video_as_path.parent),
@@ -308,7 +305,6 @@ def analyze(
                         break
                     else:
                         logger.critical('no related file found. exiting...')
-                        from highlighter.core.exceptions import FileSystemError
                         raise FileSystemError(
                             "No suitable video file found after user interaction",
                             path=str(path_to_video),
@@ -319,7 +315,6 @@ def analyze(
                         )
         except Exception as e:
             if not isinstance(e, (FileSystemError, KeyboardInterrupt)):
-                from highlighter.core.exceptions import FileSystemError
                 raise FileSystemError(
                     f"Error during file similarity check: {str(e)}",
                     path=str(path_to_video),
@@ -336,7 +331,6 @@ def analyze(
             logger.info(f'Using related file: {related_file}')
             path_to_video = related_file
         else:
-            from highlighter.core.exceptions import FileSystemError
             raise FileSystemError(
                 f"Video file not found and no suitable alternative located: {path_to_video}",
                 path=str(path_to_video),
@@ -352,7 +346,6 @@ def analyze(
         try:
             output_as_path.mkdir(parents=True, exist_ok=True)
         except (OSError, PermissionError) as e:
-            from highlighter.core.exceptions import FileSystemError
             raise FileSystemError(
                 f"Cannot create output directory: {output_directory}",
                 path=str(output_as_path),
@@ -365,7 +358,6 @@ def analyze(
                 ]
             )
     elif not output_as_path.is_dir():
-        from highlighter.core.exceptions import FileSystemError
         raise FileSystemError(
             f"Output path exists but is not a directory: {output_directory}",
             path=str(output_as_path),
@@ -5,6 +5,7 @@ import time
 import json
 import os
 import asyncio
+import threading
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -19,6 +20,169 @@ from loguru import logger
 from highlighter import processor, common, console
 from highlighter.animations import CyberLoadingAnimation, create_clip_processing_animation
 
+# Try to import numba for the JIT-compiled detection kernel, fall back to plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Highlight kinds returned by the detection kernel
+DETECT_NONE = 0
+DETECT_SUSTAINED = 1
+DETECT_SPIKE = 2
+DETECT_DYNAMIC = 3
+
+
+@njit(cache=True)
+def _detect(max_db, rw_max, rw_avg, n_window, thr, sustained_n,
+            captured, n_captured, pos, min_gap):
+    """Decide whether the current second is a highlight.
+    
+    Args:
+        max_db (float): peak decibel of the current second.
+        rw_max (np.ndarray): rolling window of per-second peaks in decibels.
+        rw_avg (np.ndarray): rolling window of per-second averages in decibels.
+        n_window (int): number of valid entries in the rolling window.
+        thr (float): decibel threshold.
+        sustained_n (int): seconds above threshold needed for a sustained highlight.
+        captured (np.ndarray): sorted positions of already captured highlights.
+        n_captured (int): number of valid entries in ``captured``.
+        pos (int): current position in seconds.
+        min_gap (int): minimum distance between two highlights.
+    
+    Returns:
+        int: one of the ``DETECT_*`` constants.
+    """
+    if max_db < thr:
+        return DETECT_NONE
+    
+    # Reject positions overlapping an existing clip (captured is sorted)
+    i = np.searchsorted(captured[:n_captured], pos)
+    if i < n_captured and abs(captured[i] - pos) < min_gap:
+        return DETECT_NONE
+    if i > 0 and abs(captured[i - 1] - pos) < min_gap:
+        return DETECT_NONE
+    
+    sustained_count = 0
+    for k in range(n_window):
+        if rw_max[k] >= thr:
+            sustained_count += 1
+    if sustained_count >= sustained_n:
+        return DETECT_SUSTAINED
+    
+    if max_db >= thr + 3.0:
+        return DETECT_SPIKE
+    
+    if n_window >= 3:
+        # Rolling average + 6 dB
+        total = 0.0
+        for k in range(n_window):
+            total += rw_avg[k]
+        if max_db >= total / n_window + 6.0:
+            return DETECT_DYNAMIC
+    
+    return DETECT_NONE
+
+
+# Only the tail of FFmpeg's stderr is kept; the actual error is printed last
+_STDERR_TAIL_SIZE = 8192
+
+
+def _run_ffmpeg(cmd: List[str], timeout: float) -> tuple:
+    """Run an FFmpeg command, keeping the tail of stderr when it fails.
+    
+    Args:
+        cmd (List[str]): command line to execute.
+        timeout (float): seconds to wait before killing the process.
+    
+    Returns:
+        tuple: (returncode, stderr text; empty on success).
+    
+    Raises:
+        subprocess.TimeoutExpired: if the process did not finish in time.
+    """
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    ) as p:
+        # communicate() drains stderr while waiting, so a chatty process
+        # cannot block on a full pipe and surface as a timeout
+        try:
+            _, stderr = p.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.communicate()
+            raise
+    
+    if p.returncode == 0:
+        return p.returncode, ''
+    return p.returncode, stderr[-_STDERR_TAIL_SIZE:].decode(errors='replace')
+
+
+# Seconds probed past each clip end when looking for the keyframe to snap to
+KEYFRAME_SEARCH_MARGIN = 10
+
+
+def _keyframe_intervals(highlights: dict, start_point: int, end_point: int) -> tuple:
+    """Get the ranges to probe for keyframes around each highlight's clip."""
+    return tuple(
+        (max(0, int(p) - start_point), int(p) + end_point + KEYFRAME_SEARCH_MARGIN)
+        for p in sorted(highlights, key=int)
+    )
+
+
+def _coalesce_clip_ranges(highlights: dict, keyframes: np.ndarray,
+                          start_point: int, end_point: int,
+                          max_end_snap: float = KEYFRAME_SEARCH_MARGIN) -> Dict[int, tuple]:
+    """Snap clip ranges to keyframes and merge the ones that overlap.
+    
+    Stream-copy cuts always start on a keyframe, so highlights sharing a GOP
+    would otherwise produce near-identical files.
+    
+    Args:
+        highlights (dict): captured highlights keyed by position.
+        keyframes (np.ndarray): sorted keyframe times; empty disables snapping.
+        start_point (int): seconds to include before each highlight.
+        end_point (int): seconds to include after each highlight.
+        max_end_snap (float): ends are only extended to a keyframe at most this
+            many seconds away, since only that far past each clip is probed.
+    
+    Returns:
+        Dict[int, tuple]: (start, end) in seconds, keyed by the first highlight
+        position of each merged range.
+    """
+    positions = sorted(highlights, key=int)
+    starts = np.array([max(0, int(p) - start_point) for p in positions], dtype=np.float64)
+    ends = np.array([int(p) + end_point for p in positions], dtype=np.float64)
+    
+    if keyframes.size:
+        # Start on the last keyframe <= start, end on the first keyframe >= end
+        idx = np.searchsorted(keyframes, starts, side='right') - 1
+        starts = np.where(idx >= 0, keyframes[np.maximum(idx, 0)], starts)
+        idx = np.searchsorted(keyframes, ends, side='left')
+        snapped = keyframes[np.minimum(idx, keyframes.size - 1)]
+        ends = np.where((idx < keyframes.size) & (snapped - ends <= max_end_snap), snapped, ends)
+    
+    ranges = {}
+    current = None
+    for position, start, end in zip(positions, starts.tolist(), ends.tolist()):
+        if current is not None and start < ranges[current][1]:
+            ranges[current] = (ranges[current][0], max(ranges[current][1], end))
+        else:
+            current = position
+            ranges[current] = (start, end)
+    return ranges
+
+
 @dataclass
 class BatchJob:
     """Represents a single video processing job in a batch."""
@@ -174,15 +338,6 @@ class StreamingAudioAnalysis:
         self._captured_result = {}
         self._subprocesses = []
         
-    def _already_captured(self, pos: int) -> bool:
-        """Check if this position would overlap with existing clips."""
-        min_gap = max(30, self.start_point + self.end_point)
-        
-        for existing_pos in self._captured_result.keys():
-            if abs(int(existing_pos) - pos) < min_gap:
-                return True
-        return False
-    
     def _add_highlight(self, position: int, decibel: float):
         """Add a highlight to the results."""
         highlight = common.HighlightedMoment(
@@ -191,76 +346,79 @@ class StreamingAudioAnalysis:
         )
         self._captured_result[position] = highlight
     
+    def _record_captured(self, position: int):
+        """Append a captured position to the sorted array used by the detection kernel."""
+        if self._n_captured == self._captured_pos.size:
+            self._captured_pos = np.resize(self._captured_pos, max(16, self._captured_pos.size * 2))
+        self._captured_pos[self._n_captured] = position
+        self._n_captured += 1
+    
     def streaming_crest_ceiling_algorithm(self):
         """Enhanced streaming algorithm with intelligent detection."""
         logger.info("Starting streaming audio analysis...")
         
         # Enhanced parameters
         sustained_threshold_duration = 3
-        rolling_window = []
         rolling_window_size = 5
+        min_gap = max(30, self.start_point + self.end_point)
+        threshold = float(self.decibel_threshold)
+        
+        # Carry the last readings across blocks so windows span block boundaries
+        self._rw_max = np.empty(0, dtype=np.float64)
+        self._rw_avg = np.empty(0, dtype=np.float64)
+        self._captured_pos = np.empty(16, dtype=np.int64)
+        self._n_captured = 0
+        carry = rolling_window_size - 1
         
         t0 = time.time()
         total_duration = self.audio_processor.duration
-        processed_duration = 0.0
         
         with AudioAnalysisProgress(console=console, transient=True, refresh_per_second=30) as progress:
             task = progress.add_task('[dim]streaming analysis...', total=total_duration)
             
-            for decibel_data, position in self.audio_processor.decibel_iter():
-                if not decibel_data:
+            for mx, av, pos in self.audio_processor.decibel_blocks(64):
+                if mx.size == 0:
                     continue
-                    
-                max_decibel = max(decibel_data) if decibel_data else -60.0
-                avg_decibel = sum(decibel_data) / len(decibel_data) if decibel_data else -60.0
                 
-                # Update rolling window
-                rolling_window.append({
-                    'position': position,
-                    'max_db': max_decibel,
-                    'avg_db': avg_decibel
-                })
+                ext_max = np.concatenate((self._rw_max, mx))
+                ext_avg = np.concatenate((self._rw_avg, av))
+                base = self._rw_max.size
                 
-                if len(rolling_window) > rolling_window_size:
-                    rolling_window.pop(0)
+                # Only readings above threshold can become highlights; everything
+                # else is skipped without entering the Python loop
+                for i in np.flatnonzero(mx >= threshold):
+                    j = base + i
+                    lo = max(0, j - rolling_window_size + 1)
+                    position = int(pos[i])
+                    max_decibel = float(mx[i])
+                    
+                    kind = _detect(
+                        max_decibel, ext_max[lo:j + 1], ext_avg[lo:j + 1], j + 1 - lo,
+                        threshold, sustained_threshold_duration, self._captured_pos,
+                        self._n_captured, position, min_gap
+                    )
+                    
+                    if kind != DETECT_NONE:
+                        self._add_highlight(position, max_decibel)
+                        self._record_captured(position)
+                        if kind == DETECT_SUSTAINED:
+                            logger.debug(f"Sustained highlight at {pos[i]}s: {max_decibel:.1f}dB")
+                        elif kind == DETECT_SPIKE:
+                            logger.debug(f"Spike highlight at {pos[i]}s: {max_decibel:.1f}dB")
+                        else:
+                            logger.debug(f"Dynamic highlight at {pos[i]}s: {max_decibel:.1f}dB")
+                        progress.update(task, description=f'[dim]captured[/] [yellow bold]{len(self._captured_result)}[/] [dim]highlights so far...')
                 
-                # Enhanced detection logic
-                if max_decibel >= self.decibel_threshold:
-                    if not self._already_captured(int(position)):
-                        # Check for sustained loud moments
-                        sustained_count = sum(1 for w in rolling_window if w['max_db'] >= self.decibel_threshold)
-                        
-                        highlight_detected = False
-                        
-                        if sustained_count >= sustained_threshold_duration:
-                            # Strong highlight: sustained loud moment
-                            self._add_highlight(int(position), max_decibel)
-                            highlight_detected = True
-                            logger.debug(f"Sustained highlight at {position}s: {max_decibel:.1f}dB")
-                        elif max_decibel >= (self.decibel_threshold + 3):
-                            # Spike highlight: very loud brief moment
-                            self._add_highlight(int(position), max_decibel)
-                            highlight_detected = True
-                            logger.debug(f"Spike highlight at {position}s: {max_decibel:.1f}dB")
-                        elif len(rolling_window) >= 3:
-                            # Dynamic highlight: above rolling average
-                            rolling_avg = sum(w['avg_db'] for w in rolling_window) / len(rolling_window)
-                            if max_decibel >= (rolling_avg + 6):
-                                self._add_highlight(int(position), max_decibel)
-                                highlight_detected = True
-                                logger.debug(f"Dynamic highlight at {position}s: {max_decibel:.1f}dB")
-                        
-                        if highlight_detected:
-                            progress.update(task, description=f'[dim]captured[/] [yellow bold]{len(self._captured_result)}[/] [dim]highlights so far...')
+                self._rw_max = ext_max[-carry:]
+                self._rw_avg = ext_avg[-carry:]
                 
                 # Update progress
-                processed_duration = position
-                progress.update(task, completed=min(processed_duration, total_duration))
+                progress.update(task, completed=min(float(pos[-1]), total_duration))
                 
                 # Log memory usage periodically
-                if int(position) % 60 == 0:  # Every minute
+                if int(pos[0]) // 60 != int(pos[-1]) // 60:  # Every minute
                     memory_mb = self.audio_processor.get_memory_usage()
-                    logger.debug(f"Memory usage at {position}s: {memory_mb:.1f} MB")
+                    logger.debug(f"Memory usage at {pos[-1]:.0f}s: {memory_mb:.1f} MB")
             
             progress.update(task, completed=total_duration)
         
@@ -286,6 +444,19 @@ class StreamingAudioAnalysis:
         
         logger.info(f"Starting parallel generation of {len(highlights)} highlight clips")
         
+        # Highlights whose cuts snap to the same keyframes become a single clip
+        clip_ranges = _coalesce_clip_ranges(
+            self._captured_result,
+            processor.get_keyframe_times(
+                self.video_path,
+                _keyframe_intervals(self._captured_result, self.start_point, self.end_point)
+            ),
+            self.start_point,
+            self.end_point
+        )
+        if len(clip_ranges) < len(highlights):
+            logger.info(f"Coalesced {len(highlights)} highlights into {len(clip_ranges)} keyframe-aligned clips")
+        
         # Use optimized parallel clip generation
         clip_generator = OptimizedClipGenerator(max_workers=4)
         completed_count, failed_count = clip_generator.generate_clips_parallel(
@@ -293,7 +464,8 @@ class StreamingAudioAnalysis:
             self.video_path,
             self.output_path,
             self.start_point,
-            self.end_point
+            self.end_point,
+            clip_ranges=clip_ranges
         )
         
         logger.info(f"Clip generation completed: {completed_count} successful, {failed_count} failed")
@@ -303,77 +475,119 @@ class StreamingAudioAnalysis:
 class OptimizedClipGenerator:
     """Optimized parallel clip generation with better resource management and futuristic UI."""
     
+    ANIMATION_TICK_INTERVAL = 0.05  # Seconds between animation progress polls
+    
     def __init__(self, max_workers: int = 4, use_animations: bool = True):
         self.max_workers = max_workers
         self.use_animations = use_animations
-        self._animation = None
+        # Each generator owns its animation, so concurrent batch jobs keep
+        # separate counters; the spinner service renders all of them
+        self._animation: Optional[CyberLoadingAnimation] = (
+            create_clip_processing_animation() if use_animations else None
+        )
+        
+        # Progress counters owned by the main thread, polled by the animation ticker
+        self._done = 0
+        self._failed = 0
+        self._total = 0
+        self._tick_stop = threading.Event()
+        self._tick_thread = None
+    
+    def _anim_tick(self):
+        """Push progress counters into the animation until stopped."""
+        update = self._animation.update_progress
+        wait = self._tick_stop.wait
+        while not wait(self.ANIMATION_TICK_INTERVAL):
+            self._push_progress(update)
+    
+    def _push_progress(self, update: Optional[Callable] = None):
+        """Forward the current counters to the animation."""
+        update = update or self._animation.update_progress
+        total_processed = self._done + self._failed
+        if total_processed >= self._total * 0.9:  # 90% complete
+            update(total_processed, "finalizing")
+        else:
+            update(total_processed, "generating")
+    
+    def _start_ticker(self):
+        self._tick_stop.clear()
+        self._tick_thread = threading.Thread(target=self._anim_tick, daemon=True)
+        self._tick_thread.start()
+    
+    def _stop_ticker(self):
+        self._tick_stop.set()
+        if self._tick_thread is not None:
+            self._tick_thread.join(timeout=1.0)
+            self._tick_thread = None
+        # Flush the final counters so the last frame is accurate
+        self._push_progress()
         
     def generate_clips_parallel(self, highlights: dict, video_path: str, output_path: str, 
-                               start_point: int, end_point: int) -> tuple:
-        """Generate multiple clips in parallel with progress tracking and animations."""
+                               start_point: int, end_point: int,
+                               clip_ranges: Optional[Dict[int, tuple]] = None) -> tuple:
+        """Generate multiple clips in parallel with progress tracking and animations.
+        
+        When ``clip_ranges`` is given, one clip is cut per entry using its
+        (start, end) instead of the fixed start/end points around each highlight.
+        """
         
-        total_clips = len(highlights)
+        if clip_ranges is None:
+            clip_ranges = {position: None for position in highlights}
         
-        # Start futuristic animation if enabled
+        total_clips = len(clip_ranges)
+        self._done = 0
+        self._failed = 0
+        self._total = total_clips
+        
+        # Restart this generator's animation directly in the generating stage
         if self.use_animations:
-            self._animation = create_clip_processing_animation()
-            self._animation.start_clip_processing_animation(total_clips)
-            # Brief initialization phase
-            self._animation.update_progress(0, "initializing")
-            time.sleep(0.5)
-            self._animation.update_progress(0, "generating")
+            self._animation.start_clip_processing_animation(total_clips, stage="generating")
+            self._start_ticker()
         
         try:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all clip generation tasks
                 future_to_position = {}
                 
-                for position, highlight in highlights.items():
+                for position, clip_range in clip_ranges.items():
                     future = executor.submit(
                         self._generate_single_clip,
-                        video_path, position, highlight, output_path, start_point, end_point
+                        video_path, position, highlights[position], output_path,
+                        start_point, end_point, clip_range
                     )
                     future_to_position[future] = position
                 
                 # Wait for completion with progress tracking
-                completed_count = 0
-                failed_count = 0
-                
                 for future in as_completed(future_to_position, timeout=600):  # 10 minute timeout
                     position = future_to_position[future]
                     
                     try:
                         result = future.result(timeout=60)  # 1 minute per clip timeout
                         if result:
-                            completed_count += 1
+                            self._done += 1
                             logger.debug(f"Generated clip for position {position}s")
                         else:
-                            failed_count += 1
+                            self._failed += 1
                             logger.warning(f"Failed to generate clip for position {position}s")
                             
                     except concurrent.futures.TimeoutError:
-                        failed_count += 1
+                        self._failed += 1
                         logger.error(f"Timeout generating clip for position {position}s")
                         
                     except Exception as e:
-                        failed_count += 1
+                        self._failed += 1
                         logger.error(f"Error generating clip for position {position}s: {e}")
                     
-                    # Update animation progress
-                    if self.use_animations and self._animation:
-                        total_processed = completed_count + failed_count
-                        if total_processed >= total_clips * 0.9:  # 90% complete
-                            self._animation.update_progress(total_processed, "finalizing")
-                        else:
-                            self._animation.update_progress(total_processed, "generating")
-                    
                     # Log progress periodically
-                    total_processed = completed_count + failed_count
-                    if total_processed % 5 == 0 or total_processed == len(highlights):
-                        logger.info(f"Clip generation progress: {total_processed}/{len(highlights)} ({completed_count} successful, {failed_count} failed)")
+                    total_processed = self._done + self._failed
+                    if total_processed % 5 == 0 or total_processed == total_clips:
+                        logger.info(f"Clip generation progress: {total_processed}/{total_clips} ({self._done} successful, {self._failed} failed)")
+            
+            completed_count, failed_count = self._done, self._failed
             
             # Stop animation with success/failure message
-            if self.use_animations and self._animation:
+            if self._animation is not None:
+                self._stop_ticker()
                 if failed_count == 0:
                     success_msg = f"All {completed_count} clips forged successfully! Your highlight arsenal is ready!"
                     self._animation.stop_animation(success=True, final_message=success_msg)
@@ -385,7 +599,8 @@ class OptimizedClipGenerator:
                     self._animation.stop_animation(success=False, final_message=error_msg)
         
         except Exception as e:
-            if self.use_animations and self._animation:
+            if self._animation is not None:
+                self._stop_ticker()
                 error_msg = f"Critical error in clip generation system: {str(e)}"
                 self._animation.stop_animation(success=False, final_message=error_msg)
             raise
@@ -393,11 +608,15 @@ class OptimizedClipGenerator:
         return completed_count, failed_count
     
     def _generate_single_clip(self, video_path: str, position: int, highlight, 
-                             output_path: str, start_point: int, end_point: int) -> bool:
+                             output_path: str, start_point: int, end_point: int,
+                             clip_range: Optional[tuple] = None) -> bool:
         """Generate a single clip with improved error handling."""
         try:
-            start = max(0, int(position) - start_point)
-            end = int(position) + end_point
+            if clip_range is not None:
+                start, end = clip_range
+            else:
+                start = max(0, int(position) - start_point)
+                end = int(position) + end_point
             
             # Better naming with timestamp and unique ID
             timestamp = str(datetime.timedelta(seconds=int(position))).replace(':', 'h', 1).replace(':', 'm', 1) + 's'
@@ -420,15 +639,9 @@ class OptimizedClipGenerator:
             ]
             
             # Run with timeout and proper error handling
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,  # 1 minute timeout per clip
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
+            returncode, stderr = _run_ffmpeg(cmd, timeout=60)  # 1 minute timeout per clip
             
-            if result.returncode == 0:
+            if returncode == 0:
                 # Verify file was created and has reasonable size
                 if os.path.exists(output_file) and os.path.getsize(output_file) > 1024:  # At least 1KB
                     return True
@@ -436,7 +649,7 @@ class OptimizedClipGenerator:
                     logger.warning(f"Clip generated but file is too small: {output_file}")
                     return False
             else:
-                logger.error(f"FFmpeg failed for position {position}: {result.stderr}")
+                logger.error(f"FFmpeg failed for position {position}: {stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -605,6 +818,19 @@ class AudioAnalysis:
             
         logger.info(f"Starting optimized parallel generation of {len(highlights)} highlight clips")
         
+        # Highlights whose cuts snap to the same keyframes become a single clip
+        clip_ranges = _coalesce_clip_ranges(
+            self._captured_result,
+            processor.get_keyframe_times(
+                self.video_path,
+                _keyframe_intervals(self._captured_result, self.start_point, self.end_point)
+            ),
+            self.start_point,
+            self.end_point
+        )
+        if len(clip_ranges) < len(highlights):
+            logger.info(f"Coalesced {len(highlights)} highlights into {len(clip_ranges)} keyframe-aligned clips")
+        
         # Use optimized parallel clip generation
         clip_generator = OptimizedClipGenerator(max_workers=4)
         completed_count, failed_count = clip_generator.generate_clips_parallel(
@@ -612,11 +838,12 @@ class AudioAnalysis:
             self.video_path,
             self.output_path,
             self.start_point,
-            self.end_point
+            self.end_point,
+            clip_ranges=clip_ranges
         )
         
         if failed_count > 0:
-            logger.warning(f"Clip generation completed: {completed_count} successful, {failed_count} failed out of {len(highlights)} total")
+            logger.warning(f"Clip generation completed: {completed_count} successful, {failed_count} failed out of {len(clip_ranges)} total")
         else:
             logger.info(f"All {completed_count} clips generated successfully")
         
@@ -6,9 +6,12 @@ Urban videogame-inspired visual feedback with ironic quips.
 
 import time
 import random
+import itertools
 import threading
-from typing import List, Optional, Callable
-from rich.console import Console
+import atexit
+from types import MappingProxyType
+from typing import List, Optional, Callable, Sequence, Tuple, Union
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn, SpinnerColumn
 from rich.text import Text
@@ -20,7 +23,7 @@ from rich import box
 class CyberQuips:
     """Collection of ironic and witty status messages for different processing stages."""
     
-    INITIALIZING = [
+    INITIALIZING = (
         "Initializing neural pathways...",
         "Booting up the highlight matrix...",
         "Calibrating audio receptors...",
@@ -29,9 +32,9 @@ class CyberQuips:
         "Warming up the bass cannons...",
         "Synchronizing with the beat...",
         "Activating highlight detection arrays..."
-    ]
+    )
     
-    ANALYZING = [
+    ANALYZING = (
         "Scanning for epic moments...",
         "Detecting peak gaming energy...",
         "Analyzing audio DNA for highlights...",
@@ -44,9 +47,9 @@ class CyberQuips:
         "Mapping the emotional landscape...",
         "Extracting essence of gaming excellence...",
         "Identifying viewer retention magnets..."
-    ]
+    )
     
-    GENERATING = [
+    GENERATING = (
         "Crafting highlight masterpieces...",
         "Rendering moments of glory...",
         "Compiling your greatest hits...",
@@ -59,9 +62,9 @@ class CyberQuips:
         "Synthesizing pure entertainment...",
         "Creating tomorrow's viral clips...",
         "Weaponizing your best moments..."
-    ]
+    )
     
-    FINALIZING = [
+    FINALIZING = (
         "Applying final polish...",
         "Adding that special sauce...",
         "Optimizing for maximum impact...",
@@ -70,9 +73,9 @@ class CyberQuips:
         "Fine-tuning perfection...",
         "Ensuring peak performance...",
         "Maximizing clip effectiveness..."
-    ]
+    )
     
-    COMPLETE = [
+    COMPLETE = (
         "Mission accomplished, commander!",
         "Highlight extraction complete!",
         "Your content arsenal is ready!",
@@ -81,9 +84,9 @@ class CyberQuips:
         "Achievement unlocked: Clip Master!",
         "Highlight synthesis: 100% complete!",
         "Your streaming empire awaits!"
-    ]
+    )
     
-    ERROR = [
+    ERROR = (
         "Houston, we have a problem...",
         "Something went sideways in the matrix...",
         "Error in the highlight dimension...",
@@ -92,7 +95,38 @@ class CyberQuips:
         "System malfunction in sector 7...",
         "The AI needs a coffee break...",
         "Plot twist: unexpected error!"
-    ]
+    )
+
+
+_STAGE_QUIPS = MappingProxyType({
+    "initializing": CyberQuips.INITIALIZING,
+    "analyzing": CyberQuips.ANALYZING,
+    "generating": CyberQuips.GENERATING,
+    "finalizing": CyberQuips.FINALIZING
+})
+
+_STAGE_EMOJI = MappingProxyType({
+    "initializing": "🔄",
+    "analyzing": "🔍",
+    "generating": "⚡",
+    "finalizing": "✨"
+})
+
+# Markup is parsed once at import rather than on every print
+_BOOT_LINES = tuple(Text.from_markup(line) for line in (
+    "[green]HIGHLIGHT EXTRACTION SYSTEM v3.0[/]",
+    "[dim]Booting neural networks...[/]",
+    "[dim]Loading audio analysis modules...[/]",
+    "[dim]Initializing clip generation engine...[/]",
+    "[dim]Establishing quantum entanglement with FFmpeg...[/]",
+    "[bright_green]✓ All systems online[/]",
+    "",
+    "[bold cyan]Ready to extract highlights![/]"
+))
+
+_BAR_WIDTH = 30
+# Every possible progress bar, indexed by the number of filled cells
+_BAR_SEGMENTS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
 
 
 class CyberProgressBar:
@@ -101,9 +135,9 @@ class CyberProgressBar:
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
         self._current_quip = ""
-        self._quip_timer = 0
+        self._quip_index: Optional[int] = None  # Random starting point, then rotate in order
         self._quip_interval = 3.0  # Change quip every 3 seconds
-        self._last_update = time.time()
+        self._next_quip_deadline = time.monotonic() + self._quip_interval
         
     def create_cyber_progress(self, description: str = "Processing") -> Progress:
         """Create a cyberpunk-styled progress bar."""
@@ -123,21 +157,28 @@ class CyberProgressBar:
             refresh_per_second=10
         )
     
-    def get_rotating_quip(self, quips: List[str]) -> str:
+    def get_rotating_quip(self, quips: Sequence[str]) -> str:
         """Get a rotating quip that changes periodically."""
-        current_time = time.time()
+        now = time.monotonic()
         
-        if current_time - self._last_update > self._quip_interval:
-            self._current_quip = random.choice(quips)
-            self._last_update = current_time
+        if now < self._next_quip_deadline and self._current_quip:
+            return self._current_quip
         
-        if not self._current_quip:
-            self._current_quip = random.choice(quips)
+        if self._quip_index is None:
+            self._quip_index = random.randrange(len(quips))
+        elif now >= self._next_quip_deadline:
+            self._quip_index += 1
+            self._next_quip_deadline = now + self._quip_interval
         
+        self._current_quip = quips[self._quip_index % len(quips)]
         return self._current_quip
     
-    def create_status_panel(self, title: str, quip: str, style: str = "cyan") -> Panel:
-        """Create a futuristic status panel."""
+    def create_status_panel(self, title: Union[str, Text], quip: str, style: str = "cyan") -> Panel:
+        """Create a futuristic status panel.
+        
+        A pre-built Text title is used as-is; a plain string is wrapped in the
+        default styled title without going through the markup parser.
+        """
         # Create cyberpunk-style border characters
         cyber_chars = "▓▒░"
         border_style = f"bright_{style}"
@@ -148,7 +189,7 @@ class CyberProgressBar:
         
         return Panel(
             centered_quip,
-            title=f"[bold {border_style}]⚡ {title} ⚡[/]",
+            title=title if isinstance(title, Text) else Text(f"⚡ {title} ⚡", style=f"bold {border_style}"),
             border_style=border_style,
             box=box.HEAVY,
             padding=(1, 2)
@@ -178,44 +219,163 @@ class HolographicSpinner:
             "neon": self.NEON_FRAMES
         }.get(style, self.CYBER_FRAMES)
         
-        self.frame_index = 0
+        self._frames_iter = itertools.cycle(self.frames)
     
     def next_frame(self) -> str:
         """Get the next frame in the animation."""
-        frame = self.frames[self.frame_index]
-        self.frame_index = (self.frame_index + 1) % len(self.frames)
-        return frame
+        return next(self._frames_iter)
+
+
+class SpinnerService:
+    """Shared render loop for all active loading animations.
+    
+    One worker thread owns a single Live display and redraws it only when a
+    registered animation reports a visible change, instead of every animation
+    running its own thread and repainting 10 times per second.
+    """
+    
+    FRAME_INTERVAL = 0.1  # Seconds between frame checks
+    
+    _instance: Optional["SpinnerService"] = None
+    _instance_lock = threading.Lock()
+    
+    def __init__(self):
+        self._animations: List["CyberLoadingAnimation"] = []
+        self._lock = threading.Lock()
+        self._running = False
+        self._worker: Optional[threading.Thread] = None
+        self._shutdown_event = threading.Event()
+        
+        # The worker is a daemon thread, so close its display explicitly at exit
+        atexit.register(self.shutdown)
+    
+    @classmethod
+    def instance(cls) -> "SpinnerService":
+        """Get the process-wide spinner service."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def register(self, animation: "CyberLoadingAnimation"):
+        """Start rendering an animation, spinning up the worker if needed."""
+        with self._lock:
+            if animation not in self._animations:
+                self._animations.append(animation)
+            animation._last_render_key = None
+            
+            if not self._running:
+                self._running = True
+                # A closing display may still be active, so the new worker waits for it first
+                self._worker = threading.Thread(
+                    target=self._run, args=(animation.console, self._worker),
+                    name="m0-anim", daemon=True
+                )
+                self._worker.start()
+    
+    def unregister(self, animation: "CyberLoadingAnimation"):
+        """Stop rendering an animation; waits for the display to close if it was the last one."""
+        with self._lock:
+            if animation in self._animations:
+                self._animations.remove(animation)
+            worker = self._worker if not self._animations else None
+        
+        # Wake the worker so it notices the change without finishing its frame wait
+        self._shutdown_event.set()
+        
+        if worker is not None:
+            worker.join(timeout=1.0)
+    
+    def shutdown(self):
+        """Stop rendering all animations and wait for the display to close."""
+        with self._lock:
+            self._animations.clear()
+            worker = self._worker
+        self._shutdown_event.set()
+        
+        if worker is not None:
+            worker.join(timeout=1.0)
+    
+    def _run(self, console: Console, previous: Optional[threading.Thread]):
+        """Render registered animations until none are left."""
+        if previous is not None:
+            previous.join()
+        
+        try:
+            with Live(console=console, auto_refresh=False) as live:
+                while True:
+                    self._shutdown_event.clear()
+                    with self._lock:
+                        animations = tuple(self._animations)
+                        if not animations:
+                            self._running = False
+                            break
+                    
+                    # Poll every animation so each one records its latest render key
+                    now = time.monotonic()
+                    changed = [a._needs_render(now) for a in animations]
+                    if any(changed):
+                        live.update(Group(*(a._render_frame() for a in animations)), refresh=True)
+                    
+                    self._shutdown_event.wait(self.FRAME_INTERVAL)
+        except Exception:
+            # Let the next registration start a fresh run
+            with self._lock:
+                self._running = False
+            raise
 
 
 class CyberLoadingAnimation:
     """Main loading animation system with cyberpunk aesthetics."""
     
+    SPINNER_INTERVAL = 0.25  # Seconds per spinner step
+    
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
         self.progress_bar = CyberProgressBar(self.console)
         self.spinner = HolographicSpinner("cyber")
         self._is_running = False
-        self._animation_thread = None
+        self._last_render_key: Optional[tuple] = None
+        self._spin_step = 0
+        self._next_spin = 0.0
+        self._spinner_char = ""
+        self._quip = ""
+        self._progress_callback: Optional[Callable] = None
+        self._last_callback_completed = -1
         self._current_stage = "initializing"
         self._progress = 0.0
         self._total_items = 0
         self._completed_items = 0
         
+        # Styled title per spinner frame, so frames never go through the markup parser
+        self._titles = {
+            frame: Text(f"{frame} HIGHLIGHT FORGE v3.0 {frame}", style="bold bright_cyan")
+            for frame in self.spinner.frames
+        }
+        
+        # Frame skeleton reused across renders; only the text and title change
+        self._content_text = Text()
+        self._panel = Panel(
+            Align.center(self._content_text),
+            border_style="bright_cyan",
+            box=box.DOUBLE,
+            padding=(1, 3)
+        )
+        
     def start_clip_processing_animation(self, total_clips: int, 
-                                      progress_callback: Optional[Callable] = None):
+                                      progress_callback: Optional[Callable] = None,
+                                      stage: str = "initializing"):
         """Start the main clip processing animation."""
         self._total_items = total_clips
         self._completed_items = 0
+        self._progress = 0.0
         self._is_running = True
-        self._current_stage = "initializing"
+        self._current_stage = stage
+        self._progress_callback = progress_callback
+        self._last_callback_completed = -1
         
-        # Start animation in separate thread
-        self._animation_thread = threading.Thread(
-            target=self._run_animation,
-            args=(progress_callback,),
-            daemon=True
-        )
-        self._animation_thread.start()
+        # Rendering is driven by the shared spinner service
+        SpinnerService.instance().register(self)
     
     def update_progress(self, completed: int, stage: str = None):
         """Update the progress of clip processing."""
@@ -228,9 +388,7 @@ class CyberLoadingAnimation:
     def stop_animation(self, success: bool = True, final_message: str = None):
         """Stop the animation and show final result."""
         self._is_running = False
-        
-        if self._animation_thread and self._animation_thread.is_alive():
-            self._animation_thread.join(timeout=1.0)
+        SpinnerService.instance().unregister(self)
         
         # Show final result
         if success:
@@ -246,61 +404,55 @@ class CyberLoadingAnimation:
         
         self.console.print(panel)
     
-    def _run_animation(self, progress_callback: Optional[Callable] = None):
-        """Run the main animation loop."""
-        with Live(console=self.console, refresh_per_second=10) as live:
-            while self._is_running:
-                # Get current stage quips
-                quips = self._get_stage_quips()
-                
-                # Create the main display
-                display = self._create_main_display(quips)
-                
-                # Update live display
-                live.update(display)
-                
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(self._completed_items, self._total_items, self._progress)
-                
-                time.sleep(0.1)
+    def _needs_render(self, now: float) -> bool:
+        """Advance the spinner and quip, and report whether the visible frame changed."""
+        if now >= self._next_spin:
+            self._spin_step += 1
+            self._spinner_char = self.spinner.next_frame()
+            self._next_spin = now + self.SPINNER_INTERVAL
+        
+        self._quip = self.progress_bar.get_rotating_quip(self._get_stage_quips())
+        
+        key = (self._spin_step, self._quip, self._completed_items, self._total_items, self._current_stage)
+        if key == self._last_render_key:
+            return False
+        
+        self._last_render_key = key
+        return True
+    
+    def _render_frame(self):
+        """Build the current frame; called from the spinner service thread."""
+        display = self._create_main_display()
+        
+        # Call progress callback if provided, only when progress actually moved
+        completed = self._completed_items
+        if self._progress_callback and completed != self._last_callback_completed:
+            self._last_callback_completed = completed
+            self._progress_callback(completed, self._total_items, self._progress)
+        
+        return display
     
-    def _get_stage_quips(self) -> List[str]:
+    def _get_stage_quips(self) -> Tuple[str, ...]:
         """Get quips for the current stage."""
-        stage_map = {
-            "initializing": CyberQuips.INITIALIZING,
-            "analyzing": CyberQuips.ANALYZING,
-            "generating": CyberQuips.GENERATING,
-            "finalizing": CyberQuips.FINALIZING
-        }
-        return stage_map.get(self._current_stage, CyberQuips.ANALYZING)
+        return _STAGE_QUIPS.get(self._current_stage, CyberQuips.ANALYZING)
     
-    def _create_main_display(self, quips: List[str]):
-        """Create the main animated display."""
-        # Get rotating quip
-        current_quip = self.progress_bar.get_rotating_quip(quips)
+    def _create_main_display(self):
+        """Create the main animated display from the state recorded by _needs_render."""
+        current_quip = self._quip
+        spinner_char = self._spinner_char
         
         # Create progress visualization
         progress_text = self._create_progress_text()
         
-        # Create spinner
-        spinner_char = self.spinner.next_frame()
-        
         # Combine all elements
-        title = f"{spinner_char} HIGHLIGHT FORGE v3.0 {spinner_char}"
-        
-        content = Text()
+        content = self._content_text
+        content.plain = ""
         content.append(progress_text, style="bold cyan")
         content.append("\n\n")
         content.append(current_quip, style="italic bright_blue")
         
-        return Panel(
-            Align.center(content),
-            title=f"[bold bright_cyan]{title}[/]",
-            border_style="bright_cyan",
-            box=box.DOUBLE,
-            padding=(1, 3)
-        )
+        self._panel.title = self._titles[spinner_char]
+        return self._panel
     
     def _create_progress_text(self) -> str:
         """Create visual progress representation."""
@@ -308,19 +460,11 @@ class CyberLoadingAnimation:
             return "Initializing systems..."
         
         # Create a visual progress bar
-        bar_width = 30
-        filled = int((self._completed_items / self._total_items) * bar_width)
-        empty = bar_width - filled
-        
-        bar = "█" * filled + "░" * empty
+        filled = int((self._completed_items / self._total_items) * _BAR_WIDTH)
+        bar = _BAR_SEGMENTS[max(0, min(filled, _BAR_WIDTH))]
         percentage = (self._completed_items / self._total_items) * 100
         
-        stage_emoji = {
-            "initializing": "🔄",
-            "analyzing": "🔍",
-            "generating": "⚡",
-            "finalizing": "✨"
-        }.get(self._current_stage, "🔄")
+        stage_emoji = _STAGE_EMOJI.get(self._current_stage, "🔄")
         
         return f"{stage_emoji} [{bar}] {percentage:.1f}%\nClips: {self._completed_items}/{self._total_items}"
 
@@ -331,39 +475,35 @@ class RetroTerminalEffect:
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
     
+    BOOT_LINE_DELAY = 0.3  # Seconds between boot lines on a terminal
+    
     def boot_sequence(self):
         """Display a retro boot sequence."""
-        boot_lines = [
-            "[green]HIGHLIGHT EXTRACTION SYSTEM v3.0[/]",
-            "[dim]Booting neural networks...[/]",
-            "[dim]Loading audio analysis modules...[/]",
-            "[dim]Initializing clip generation engine...[/]",
-            "[dim]Establishing quantum entanglement with FFmpeg...[/]",
-            "[bright_green]✓ All systems online[/]",
-            "",
-            "[bold cyan]Ready to extract highlights![/]"
-        ]
-        
-        for line in boot_lines:
+        # Nobody watches redirected output scroll, so write it in one go
+        if not self.console.is_terminal:
+            self.console.print(Text("\n").join(_BOOT_LINES))
+            return
+        
+        last = len(_BOOT_LINES) - 1
+        for i, line in enumerate(_BOOT_LINES):
             self.console.print(line)
-            time.sleep(0.3)
+            if i < last:
+                time.sleep(self.BOOT_LINE_DELAY)
     
     def glitch_effect(self, text: str, duration: float = 2.0):
         """Create a glitch effect on text."""
         glitch_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
         original_text = text
+        n = len(original_text)
         
         start_time = time.time()
         
         with Live(console=self.console, refresh_per_second=20) as live:
             while time.time() - start_time < duration:
-                # Create glitched version
-                glitched = ""
-                for char in original_text:
-                    if random.random() < 0.1:  # 10% chance to glitch
-                        glitched += random.choice(glitch_chars)
-                    else:
-                        glitched += char
+                # Create glitched version, drawing the whole frame's randomness at once
+                mask = random.choices((False, True), weights=(9, 1), k=n)  # 10% chance to glitch
+                subs = random.choices(glitch_chars, k=n)
+                glitched = ''.join([sub if hit else char for hit, sub, char in zip(mask, subs, original_text)])
                 
                 live.update(Text(glitched, style="bold red"))
                 time.sleep(0.05)
@@ -36,7 +36,9 @@ from highlighter.core.validation import (
     validate_video_input,
     validate_output_directory,
     validate_analysis_parameters,
-    validate_batch_input
+    validate_batch_input,
+    classify_media_extension,
+    clear_validation_cache
 )
 
 from highlighter.core.logging_config import setup_logging
@@ -73,6 +75,8 @@ __all__ = [
     "validate_output_directory",
     "validate_analysis_parameters",
     "validate_batch_input",
+    "classify_media_extension",
+    "clear_validation_cache",
     
     # Logging
     "setup_logging"
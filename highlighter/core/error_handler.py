@@ -3,12 +3,16 @@ Centralized error handling and recovery system for M0 Clipper.
 Provides consistent error processing, logging, and user feedback.
 """
 
+import gc
 import logging
+import reprlib
+import shutil
 import traceback
-from typing import Optional, Dict, Any, Callable, List
+import itertools
+from collections import Counter, defaultdict, deque
+from typing import Optional, Dict, Any, Callable, List, FrozenSet, Tuple, Deque
 from dataclasses import dataclass
 from pathlib import Path
-import uuid
 
 from highlighter.core.exceptions import (
     M0ClipperException, ErrorContext, ErrorSeverity, ErrorCategory,
@@ -16,24 +20,41 @@ from highlighter.core.exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryStrategy:
     """Defines a strategy for recovering from specific types of errors."""
     name: str
     description: str
     action: Callable[[ErrorContext], Optional[Any]]
-    applicable_categories: List[ErrorCategory]
-    applicable_severities: List[ErrorSeverity]
+    applicable_categories: FrozenSet[ErrorCategory]
+    applicable_severities: FrozenSet[ErrorSeverity]
+    
+    def __post_init__(self):
+        # Accept any iterable, but keep membership tests O(1)
+        self.applicable_categories = frozenset(self.applicable_categories)
+        self.applicable_severities = frozenset(self.applicable_severities)
 
 
 class ErrorHandler:
     """Centralized error handler for M0 Clipper application."""
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    DEFAULT_MAX_HISTORY = 1000
+    
+    # FFmpeg location found by ffmpeg_recovery, shared across handlers
+    _ffmpeg_path: Optional[str] = None
+    
+    def __init__(self, logger: Optional[logging.Logger] = None, max_history: int = DEFAULT_MAX_HISTORY):
         self.logger = logger or logging.getLogger(__name__)
-        self.error_history: List[ErrorContext] = []
+        self.error_history: Deque[ErrorContext] = deque(maxlen=max_history)
+        
+        # Running aggregates over error_history, kept in step as errors are added and evicted.
+        # Keyed by enum member; .value is only read when statistics are requested.
+        self._category_counts: Counter = Counter()
+        self._severity_counts: Counter = Counter()
+        self._recoverable_count = 0
         self.recovery_strategies: List[RecoveryStrategy] = []
-        self.error_callbacks: List[Callable[[ErrorContext], None]] = []
+        self._strategy_index: Dict[Tuple[ErrorCategory, ErrorSeverity], List[RecoveryStrategy]] = defaultdict(list)
+        self.error_callbacks: Tuple[Callable[[ErrorContext], None], ...] = ()
         self._setup_default_strategies()
         
     def _setup_default_strategies(self):
@@ -51,9 +72,10 @@ class ErrorHandler:
                         if f.is_file() and f.suffix == path.suffix
                     ]
                     if similar_files:
-                        context.suggested_actions.append(
+                        context.suggested_actions = [
+                            *context.suggested_actions,
                             f"Found {len(similar_files)} similar files in the same directory"
-                        )
+                        ]
                         return str(similar_files[0])  # Return first match
             return None
         
@@ -68,21 +90,23 @@ class ErrorHandler:
         # FFmpeg path recovery
         def ffmpeg_recovery(context: ErrorContext) -> Optional[str]:
             """Try to locate FFmpeg in common locations."""
-            import shutil
-            ffmpeg_path = shutil.which('ffmpeg')
+            ffmpeg_path = ErrorHandler._ffmpeg_path or shutil.which('ffmpeg')
             if ffmpeg_path:
-                context.suggested_actions.append(
+                ErrorHandler._ffmpeg_path = ffmpeg_path
+                context.suggested_actions = [
+                    *context.suggested_actions,
                     f"FFmpeg found at: {ffmpeg_path}"
-                )
+                ]
                 return ffmpeg_path
             else:
-                context.suggested_actions.extend([
+                context.suggested_actions = [
+                    *context.suggested_actions,
                     "Install FFmpeg from https://ffmpeg.org",
                     "Add FFmpeg to your system PATH",
                     "On Windows: Use 'choco install ffmpeg'",
                     "On macOS: Use 'brew install ffmpeg'",
                     "On Linux: Use 'sudo apt install ffmpeg'"
-                ])
+                ]
             return None
         
         self.add_recovery_strategy(RecoveryStrategy(
@@ -96,9 +120,8 @@ class ErrorHandler:
         # Memory cleanup recovery
         def memory_recovery(context: ErrorContext) -> Optional[bool]:
             """Attempt to free up memory resources."""
-            import gc
             gc.collect()  # Force garbage collection
-            context.suggested_actions.append("Freed up memory resources")
+            context.suggested_actions = [*context.suggested_actions, "Freed up memory resources"]
             return True
         
         self.add_recovery_strategy(RecoveryStrategy(
@@ -112,11 +135,19 @@ class ErrorHandler:
     def add_recovery_strategy(self, strategy: RecoveryStrategy):
         """Add a new recovery strategy."""
         self.recovery_strategies.append(strategy)
+        for key in itertools.product(strategy.applicable_categories, strategy.applicable_severities):
+            self._strategy_index[key].append(strategy)
         self.logger.debug(f"Added recovery strategy: {strategy.name}")
     
+    @classmethod
+    def reset_ffmpeg_path(cls):
+        """Forget the cached FFmpeg location so the next recovery searches PATH again."""
+        cls._ffmpeg_path = None
+    
     def add_error_callback(self, callback: Callable[[ErrorContext], None]):
         """Add a callback to be notified of all errors."""
-        self.error_callbacks.append(callback)
+        # Rebuilt on registration, which is rare, so dispatch iterates an immutable tuple
+        self.error_callbacks = (*self.error_callbacks, callback)
     
     def handle_exception(
         self,
@@ -136,81 +167,112 @@ class ErrorHandler:
             ErrorContext with handling results
         """
         # Create error context
+        # metadata may be the exception's own dict, so copy on write instead of updating it
         error_context = create_error_context(exception)
         if context_data:
-            error_context.metadata.update(context_data)
+            error_context.metadata = {**error_context.metadata, **context_data}
         
         # Log the error
         self._log_error(error_context, exception)
         
         # Add to history
-        self.error_history.append(error_context)
+        self._record_error(error_context)
         
         # Attempt recovery if enabled and error is recoverable
         if attempt_recovery and error_context.recoverable:
             recovery_result = self._attempt_recovery(error_context)
             if recovery_result:
-                error_context.metadata['recovery_attempted'] = True
-                error_context.metadata['recovery_result'] = recovery_result
+                error_context.metadata = {
+                    **error_context.metadata,
+                    'recovery_attempted': True,
+                    'recovery_result': recovery_result
+                }
         
         # Notify callbacks
+        if self.error_callbacks:
+            self._dispatch_callbacks(error_context)
+        
+        return error_context
+    
+    def _dispatch_callbacks(self, error_context: ErrorContext):
+        """Notify every registered callback, isolating failures from one another."""
         for callback in self.error_callbacks:
             try:
                 callback(error_context)
             except Exception as e:
                 self.logger.error(f"Error in error callback: {e}")
-        
-        return error_context
+    
+    def _record_error(self, context: ErrorContext):
+        """Append an error to the bounded history and update the running counts."""
+        history = self.error_history
+        if len(history) == history.maxlen:
+            self._count_error(history[0], -1)
+        history.append(context)
+        self._count_error(context, 1)
+    
+    def _count_error(self, context: ErrorContext, delta: int):
+        """Adjust the running counts for one error."""
+        self._category_counts[context.category] += delta
+        self._severity_counts[context.severity] += delta
+        if context.recoverable:
+            self._recoverable_count += delta
     
     def _log_error(self, context: ErrorContext, exception: Exception):
         """Log error with appropriate level based on severity."""
-        log_message = f"[{context.error_id}] {context.message}"
+        logger = self.logger
         
         if context.severity == ErrorSeverity.CRITICAL:
-            self.logger.critical(log_message, exc_info=exception)
+            level = logging.CRITICAL
         elif context.severity == ErrorSeverity.HIGH:
-            self.logger.error(log_message, exc_info=exception)
+            level = logging.ERROR
         elif context.severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(log_message)
+            level = logging.WARNING
         else:
-            self.logger.info(log_message)
+            level = logging.INFO
+        
+        # Skip message building and traceback capture when the record would be dropped
+        if logger.isEnabledFor(level):
+            log_message = f"[{context.error_id}] {context.message}"
+            exc_info = exception if level >= logging.ERROR else None
+            logger.log(level, log_message, exc_info=exc_info)
         
-        if context.technical_details:
-            self.logger.debug(f"Technical details: {context.technical_details}")
+        if logger.isEnabledFor(logging.DEBUG):
+            technical_details = context.technical_details
+            if technical_details:
+                logger.debug(f"Technical details: {technical_details}")
     
     def _attempt_recovery(self, context: ErrorContext) -> Optional[Any]:
         """Attempt to recover from an error using available strategies."""
-        applicable_strategies = [
-            strategy for strategy in self.recovery_strategies
-            if (context.category in strategy.applicable_categories and
-                context.severity in strategy.applicable_severities)
-        ]
+        logger = self.logger
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        for strategy in applicable_strategies:
+        for strategy in self._strategy_index.get((context.category, context.severity), ()):
             try:
-                self.logger.debug(f"Attempting recovery strategy: {strategy.name}")
+                if debug_enabled:
+                    logger.debug(f"Attempting recovery strategy: {strategy.name}")
                 result = strategy.action(context)
                 if result is not None:
-                    self.logger.info(f"Recovery successful with strategy: {strategy.name}")
+                    logger.info(f"Recovery successful with strategy: {strategy.name}")
                     return result
             except Exception as e:
-                self.logger.warning(f"Recovery strategy {strategy.name} failed: {e}")
+                logger.warning(f"Recovery strategy {strategy.name} failed: {e}")
         
         return None
     
     def get_user_friendly_message(self, error_context: ErrorContext) -> str:
         """Generate a comprehensive user-friendly error message."""
-        message_parts = [error_context.user_message]
+        message = error_context.user_message
         
-        if error_context.suggested_actions:
-            message_parts.append("\nSuggested actions:")
-            for i, action in enumerate(error_context.suggested_actions, 1):
-                message_parts.append(f"  {i}. {action}")
+        actions = error_context.suggested_actions
+        if actions:
+            message += "\n\nSuggested actions:\n" + "\n".join(
+                [f"  {i}. {action}" for i, action in enumerate(actions, 1)]
+            )
         
         if error_context.error_id:
-            message_parts.append(f"\nError ID: {error_context.error_id}")
+            message += f"\n\nError ID: {error_context.error_id}"
         
-        return "\n".join(message_parts)
+        return message
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get statistics about handled errors."""
@@ -218,38 +280,34 @@ class ErrorHandler:
             return {"total_errors": 0}
         
         total_errors = len(self.error_history)
-        by_category = {}
-        by_severity = {}
-        recoverable_count = 0
-        
-        for error in self.error_history:
-            # Count by category
-            category = error.category.value
-            by_category[category] = by_category.get(category, 0) + 1
-            
-            # Count by severity
-            severity = error.severity.value
-            by_severity[severity] = by_severity.get(severity, 0) + 1
-            
-            # Count recoverable
-            if error.recoverable:
-                recoverable_count += 1
+        by_category = {category.value: n for category, n in self._category_counts.items() if n}
+        by_severity = {severity.value: n for severity, n in self._severity_counts.items() if n}
         
         return {
             "total_errors": total_errors,
             "by_category": by_category,
             "by_severity": by_severity,
-            "recoverable_percentage": (recoverable_count / total_errors) * 100,
-            "most_common_category": max(by_category.items(), key=lambda x: x[1])[0] if by_category else None,
-            "most_common_severity": max(by_severity.items(), key=lambda x: x[1])[0] if by_severity else None
+            "recoverable_percentage": (self._recoverable_count / total_errors) * 100,
+            "most_common_category": max(by_category, key=by_category.__getitem__) if by_category else None,
+            "most_common_severity": max(by_severity, key=by_severity.__getitem__) if by_severity else None
         }
     
     def clear_error_history(self):
         """Clear the error history (useful for testing or cleanup)."""
         self.error_history.clear()
+        self._category_counts.clear()
+        self._severity_counts.clear()
+        self._recoverable_count = 0
         self.logger.debug("Error history cleared")
 
 
+# Bounded argument formatter for safe_execute, so large arguments are never stringified whole
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = 80
+_ARG_REPR.maxother = 80
+_ARG_REPR.maxlist = _ARG_REPR.maxtuple = _ARG_REPR.maxdict = 5
+
+
 # Global error handler instance
 _global_error_handler: Optional[ErrorHandler] = None
 
@@ -294,11 +352,11 @@ def safe_execute(
     try:
         return func(*args, **kwargs)
     except Exception as e:
-        context = context_data or {}
-        context.update({
+        context = {
+            **(context_data or {}),
             'function_name': func.__name__,
-            'args': str(args)[:100],  # Limit length
-            'kwargs': str(kwargs)[:100]
-        })
+            'args': _ARG_REPR.repr(args),
+            'kwargs': _ARG_REPR.repr(kwargs)
+        }
         handle_error(e, context)
         return default_return
\ No newline at end of file
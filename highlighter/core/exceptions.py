@@ -3,11 +3,13 @@ Core error handling and exception framework for M0 Clipper.
 Provides centralized error management, recovery strategies, and user-friendly error reporting.
 """
 
-from typing import Optional, Dict, Any, Callable, Type
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Type, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 import traceback
 import logging
+import itertools
+import os
 
 
 class ErrorSeverity(Enum):
@@ -31,7 +33,21 @@ class ErrorCategory(Enum):
     INTERNAL = "internal"           # Internal application logic errors
 
 
-@dataclass
+# Default user-facing message per category, used when none is given explicitly
+_USER_MESSAGES: Dict[ErrorCategory, str] = {
+    ErrorCategory.USER_INPUT: "Please check your input and try again.",
+    ErrorCategory.FILE_SYSTEM: "There was a problem accessing the file or directory.",
+    ErrorCategory.AUDIO_PROCESSING: "An error occurred while processing the audio.",
+    ErrorCategory.VIDEO_PROCESSING: "An error occurred while processing the video.",
+    ErrorCategory.NETWORK: "A network error occurred. Please check your internet connection.",
+    ErrorCategory.SYSTEM: "A system resource error occurred.",
+    ErrorCategory.CONFIGURATION: "There's an issue with the application configuration.",
+    ErrorCategory.DEPENDENCY: "A required component is missing or not working properly.",
+    ErrorCategory.INTERNAL: "An internal error occurred. Please try again."
+}
+
+
+@dataclass(slots=True)
 class ErrorContext:
     """Context information for error incidents."""
     error_id: str
@@ -39,10 +55,51 @@ class ErrorContext:
     severity: ErrorSeverity
     message: str
     user_message: str
-    technical_details: Optional[str] = None
-    suggested_actions: Optional[list] = None
+    details: Optional[str] = None  # backs technical_details
+    suggested_actions: Sequence[str] = ()
     recoverable: bool = True
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    exception_traceback: Optional[traceback.TracebackException] = field(
+        default=None, repr=False, compare=False
+    )
+    
+    # Written out so technical_details stays a constructor argument next to the property
+    def __init__(
+        self,
+        error_id: str,
+        category: ErrorCategory,
+        severity: ErrorSeverity,
+        message: str,
+        user_message: str,
+        technical_details: Optional[str] = None,
+        suggested_actions: Sequence[str] = (),
+        recoverable: bool = True,
+        metadata: Optional[Dict[str, Any]] = None,
+        exception_traceback: Optional[traceback.TracebackException] = None,
+        *,
+        details: Optional[str] = None  # field name, so dataclasses.replace() keeps it
+    ):
+        self.error_id = error_id
+        self.category = category
+        self.severity = severity
+        self.message = message
+        self.user_message = user_message
+        self.details = technical_details if technical_details is not None else details
+        self.suggested_actions = suggested_actions
+        self.recoverable = recoverable
+        self.metadata = metadata if metadata is not None else {}
+        self.exception_traceback = exception_traceback
+    
+    @property
+    def technical_details(self) -> Optional[str]:
+        """Technical details, formatting a captured traceback on first read."""
+        if self.details is None and self.exception_traceback is not None:
+            self.details = "".join(self.exception_traceback.format())
+        return self.details
+    
+    @technical_details.setter
+    def technical_details(self, value: Optional[str]):
+        self.details = value
 
 
 class M0ClipperException(Exception):
@@ -55,33 +112,20 @@ class M0ClipperException(Exception):
         severity: ErrorSeverity = ErrorSeverity.MEDIUM,
         user_message: Optional[str] = None,
         technical_details: Optional[str] = None,
-        suggested_actions: Optional[list] = None,
+        suggested_actions: Optional[Sequence[str]] = None,
         recoverable: bool = True,
         metadata: Optional[Dict[str, Any]] = None
     ):
         super().__init__(message)
         self.category = category
         self.severity = severity
-        self.user_message = user_message or self._generate_user_message()
+        self.user_message = user_message or _USER_MESSAGES.get(category, "An unexpected error occurred.")
         self.technical_details = technical_details
-        self.suggested_actions = suggested_actions or []
+        # Shared empty tuple by default; code adding actions replaces the sequence instead of appending
+        self.suggested_actions = suggested_actions or ()
         self.recoverable = recoverable
-        self.metadata = metadata or {}
-        
-    def _generate_user_message(self) -> str:
-        """Generate user-friendly message based on category."""
-        messages = {
-            ErrorCategory.USER_INPUT: "Please check your input and try again.",
-            ErrorCategory.FILE_SYSTEM: "There was a problem accessing the file or directory.",
-            ErrorCategory.AUDIO_PROCESSING: "An error occurred while processing the audio.",
-            ErrorCategory.VIDEO_PROCESSING: "An error occurred while processing the video.",
-            ErrorCategory.NETWORK: "A network error occurred. Please check your internet connection.",
-            ErrorCategory.SYSTEM: "A system resource error occurred.",
-            ErrorCategory.CONFIGURATION: "There's an issue with the application configuration.",
-            ErrorCategory.DEPENDENCY: "A required component is missing or not working properly.",
-            ErrorCategory.INTERNAL: "An internal error occurred. Please try again."
-        }
-        return messages.get(self.category, "An unexpected error occurred.")
+        # Subclasses fill this in right after construction, so it stays a real per-instance dict
+        self.metadata = metadata if metadata is not None else {}
 
 
 class ValidationError(M0ClipperException):
@@ -181,14 +225,10 @@ def register_error_handler(exception_type: Type[M0ClipperException], handler: Er
 
 def handle_error(exception: M0ClipperException) -> Optional[Any]:
     """Handle an error using registered handlers or default behavior."""
-    # Try specific handler first
-    handler = _error_handlers.get(type(exception))
-    if handler:
-        return handler(exception)
-    
-    # Try base class handlers
-    for exc_type, handler in _error_handlers.items():
-        if isinstance(exception, exc_type):
+    # Walk the class hierarchy from most to least specific, one dict lookup per class
+    for exc_type in type(exception).__mro__:
+        handler = _error_handlers.get(exc_type)
+        if handler:
             return handler(exception)
     
     # Default handling
@@ -196,13 +236,21 @@ def handle_error(exception: M0ClipperException) -> Optional[Any]:
     return None
 
 
+# Error ids are unique within a process: a pid tag followed by a running sequence number
+_error_seq = itertools.count()
+_proc_tag = f"{os.getpid():04x}"
+
+
+def _next_error_id() -> str:
+    """Get a short process-local error id."""
+    return f"{_proc_tag}{next(_error_seq):04x}"
+
+
 def create_error_context(exception: Exception, error_id: str = None) -> ErrorContext:
     """Create an ErrorContext from any exception."""
-    import uuid
-    
     if isinstance(exception, M0ClipperException):
         return ErrorContext(
-            error_id=error_id or str(uuid.uuid4())[:8],
+            error_id=error_id or _next_error_id(),
             category=exception.category,
             severity=exception.severity,
             message=str(exception),
@@ -215,11 +263,14 @@ def create_error_context(exception: Exception, error_id: str = None) -> ErrorCon
     else:
         # Convert standard exceptions to our format
         return ErrorContext(
-            error_id=error_id or str(uuid.uuid4())[:8],
+            error_id=error_id or _next_error_id(),
             category=ErrorCategory.INTERNAL,
             severity=ErrorSeverity.MEDIUM,
             message=str(exception),
             user_message="An unexpected error occurred. Please try again.",
-            technical_details=traceback.format_exc(),
+            # Formatted only if someone reads it; source lines are looked up then too
+            exception_traceback=traceback.TracebackException.from_exception(
+                exception, limit=20, lookup_lines=False
+            ),
             recoverable=True
         )
\ No newline at end of file
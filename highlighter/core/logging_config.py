@@ -3,16 +3,57 @@ Centralized logging configuration for M0 Clipper.
 Provides consistent, structured logging across all modules.
 """
 
+import functools
 import logging
 import logging.handlers
 import sys
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime
 
 from loguru import logger as loguru_logger
 
 
+# Console formats; the plain variants skip loguru's color markup when stderr is redirected
+_CONSOLE_FMT_COLOR = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+_CONSOLE_FMT_PLAIN = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}"
+_SHORT_FMT_COLOR = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+_SHORT_FMT_PLAIN = "{time:HH:mm:ss} | {level: <8} | {message}"
+
+
+# Frames between LoguruHandler.emit and the code calling logger.info() etc.,
+# so loguru reports the original call site instead of the logging internals
+_FORWARD_DEPTH = 6
+_forward_logger = loguru_logger.opt(depth=_FORWARD_DEPTH)
+
+
+class LoguruHandler(logging.Handler):
+    """Standard logging handler that forwards records to loguru."""
+    
+    def emit(self, record):
+        try:
+            _forward_logger.log(record.levelname, record.getMessage())
+        except Exception:
+            self.handleError(record)
+
+
+# Shared by every standard logger handed out by M0ClipperLogger
+_LOGURU_HANDLER = LoguruHandler()
+
+
+def _stderr_is_tty() -> bool:
+    """Check whether stderr is an interactive terminal."""
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
 class M0ClipperLogger:
     """Centralized logger for M0 Clipper with multiple output formats."""
     
@@ -28,49 +69,57 @@ class M0ClipperLogger:
         self.log_dir.mkdir(exist_ok=True)
         
     def _setup_loguru(self):
-        """Configure loguru for structured logging."""
+        """Configure loguru for structured logging.
+        
+        Every sink is enqueued so formatting and file I/O happen on loguru's
+        writer thread instead of the thread that logged. The file sinks write
+        JSON lines, which compress well when rotated.
+        """
         # Remove default handler
         loguru_logger.remove()
         
-        # Console handler with colors
+        # Console handler, with colors only on a terminal
+        colorize = _stderr_is_tty()
         loguru_logger.add(
             sys.stderr,
             level=self.log_level,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-                   "<level>{level: <8}</level> | "
-                   "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-                   "<level>{message}</level>",
-            colorize=True
+            format=_CONSOLE_FMT_COLOR if colorize else _CONSOLE_FMT_PLAIN,
+            colorize=colorize,
+            enqueue=True
         )
         
         # File handler for all logs
         loguru_logger.add(
             self.log_dir / "m0_clipper.log",
             level="DEBUG",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+            serialize=True,
             rotation="10 MB",
             retention="1 month",
-            compression="zip"
+            compression="zip",
+            enqueue=True
         )
         
         # Error-only file handler
         loguru_logger.add(
             self.log_dir / "errors.log",
             level="ERROR",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}\n{exception}",
+            serialize=True,
             rotation="5 MB",
             retention="3 months",
-            compression="zip"
+            compression="zip",
+            enqueue=True
         )
         
         # Performance log for timing information
         loguru_logger.add(
             self.log_dir / "performance.log",
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {message}",
+            format="{time:x} {extra[operation]} {extra[duration_ns]}",
             filter=lambda record: "PERF" in record["extra"],
             rotation="5 MB",
-            retention="1 week"
+            retention="1 week",
+            compression="zip",
+            enqueue=True
         )
     
     def get_logger(self, name: str) -> logging.Logger:
@@ -81,17 +130,8 @@ class M0ClipperLogger:
             standard_logger.setLevel(getattr(logging, self.log_level))
             
             # Add handler that forwards to loguru
-            class LoguruHandler(logging.Handler):
-                def emit(self, record):
-                    try:
-                        level = record.levelname
-                        message = record.getMessage()
-                        loguru_logger.opt(depth=1).log(level, message)
-                    except Exception:
-                        self.handleError(record)
-            
             if not standard_logger.handlers:
-                standard_logger.addHandler(LoguruHandler())
+                standard_logger.addHandler(_LOGURU_HANDLER)
                 standard_logger.propagate = False
             
             self.loggers[name] = standard_logger
@@ -100,27 +140,13 @@ class M0ClipperLogger:
     
     def log_performance(self, operation: str, duration: float, metadata: Optional[Dict[str, Any]] = None):
         """Log performance metrics."""
-        perf_data = {
-            "operation": operation,
-            "duration_seconds": duration,
-            "timestamp": datetime.now().isoformat()
-        }
-        if metadata:
-            perf_data.update(metadata)
-        
-        loguru_logger.bind(PERF=True).info(
+        # loguru stamps the record itself, so no timestamp is formatted here
+        loguru_logger.bind(PERF=True, operation=operation, duration_ns=int(duration * 1e9)).info(
             f"PERFORMANCE | {operation} | {duration:.3f}s | {metadata or {}}"
         )
     
     def log_user_action(self, action: str, details: Optional[Dict[str, Any]] = None):
         """Log user actions for analytics and debugging."""
-        user_data = {
-            "action": action,
-            "timestamp": datetime.now().isoformat()
-        }
-        if details:
-            user_data.update(details)
-        
         loguru_logger.info(f"USER_ACTION | {action} | {details or {}}")
     
     def set_level(self, level: str):
@@ -139,25 +165,33 @@ class M0ClipperLogger:
 # Global logger instance
 _global_logger: Optional[M0ClipperLogger] = None
 
+# Whether performance metrics are recorded; off until setup_logging enables it
+_PERF_ENABLED = False
+
 
 def setup_logging(
     log_dir: Optional[Path] = None, 
     log_level: str = "INFO",
-    enable_file_logging: bool = True
+    enable_file_logging: bool = True,
+    enable_performance: bool = True
 ) -> M0ClipperLogger:
     """Setup global logging configuration."""
-    global _global_logger
+    global _global_logger, _PERF_ENABLED
+    
+    _PERF_ENABLED = enable_performance
     
     if enable_file_logging:
         _global_logger = M0ClipperLogger(log_dir, log_level)
     else:
         # Console-only logging for testing
         loguru_logger.remove()
+        colorize = _stderr_is_tty()
         loguru_logger.add(
             sys.stderr,
             level=log_level,
-            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-            colorize=True
+            format=_SHORT_FMT_COLOR if colorize else _SHORT_FMT_PLAIN,
+            colorize=colorize,
+            enqueue=True
         )
         _global_logger = M0ClipperLogger(None, log_level)
     
@@ -173,7 +207,7 @@ def get_logger(name: str) -> logging.Logger:
 
 def log_performance(operation: str, duration: float, metadata: Optional[Dict[str, Any]] = None):
     """Log performance metrics."""
-    if _global_logger:
+    if _PERF_ENABLED and _global_logger:
         _global_logger.log_performance(operation, duration, metadata)
 
 
@@ -189,15 +223,15 @@ class PerformanceTimer:
     def __init__(self, operation_name: str, metadata: Optional[Dict[str, Any]] = None):
         self.operation_name = operation_name
         self.metadata = metadata or {}
-        self.start_time = None
+        self.start_ns: Optional[int] = None
         
     def __enter__(self):
-        self.start_time = datetime.now()
+        self.start_ns = time.perf_counter_ns()
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = (datetime.now() - self.start_time).total_seconds()
+        if self.start_ns is not None:
+            duration = (time.perf_counter_ns() - self.start_ns) * 1e-9
             
             # Add exception info if one occurred
             if exc_type:
@@ -211,8 +245,13 @@ class PerformanceTimer:
 def log_performance_decorator(operation_name: Optional[str] = None):
     """Decorator to automatically log function performance."""
     def decorator(func):
+        name = operation_name or f"{func.__module__}.{func.__name__}"
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            name = operation_name or f"{func.__module__}.{func.__name__}"
+            # Checked per call, since modules are usually decorated before logging is set up
+            if not _PERF_ENABLED:
+                return func(*args, **kwargs)
             with PerformanceTimer(name):
                 return func(*args, **kwargs)
         return wrapper
@@ -220,19 +259,22 @@ def log_performance_decorator(operation_name: Optional[str] = None):
 
 
 # Module-specific logger setup
+# Default level by last dotted component of the module name
+_MODULE_LEVEL_OVERRIDES = {
+    'gui': logging.INFO,  # GUI modules might want less verbose logging by default
+    'processor': logging.DEBUG,  # Processor modules might want detailed logging
+    'analyzer': logging.DEBUG  # Analyzer modules might want performance logging
+}
+
+
 def setup_module_logger(module_name: str) -> logging.Logger:
     """Setup a logger for a specific module with appropriate configuration."""
     logger = get_logger(module_name)
     
     # Add module-specific configuration if needed
-    if module_name.endswith('.gui'):
-        # GUI modules might want less verbose logging by default
-        logger.setLevel(logging.INFO)
-    elif module_name.endswith('.processor'):
-        # Processor modules might want detailed logging
-        logger.setLevel(logging.DEBUG)
-    elif module_name.endswith('.analyzer'):
-        # Analyzer modules might want performance logging
-        logger.setLevel(logging.DEBUG)
+    _, dot, leaf = module_name.rpartition('.')
+    level = _MODULE_LEVEL_OVERRIDES.get(leaf) if dot else None
+    if level is not None:
+        logger.setLevel(level)
     
     return logger
\ No newline at end of file
@@ -5,20 +5,92 @@ Provides comprehensive validation for user inputs, file paths, and configuration
 
 import os
 import re
+import glob
+import stat
+import functools
 from pathlib import Path
-from typing import Union, List, Optional, Any, Dict
+from typing import Union, List, Optional, Any, Dict, Collection
 from urllib.parse import urlparse
 
 from highlighter.core.exceptions import ValidationError, FileSystemError
 
 
+# Constant suggested actions shared by every raise site
+_FILE_NOT_FOUND_ACTIONS = (
+    "Check the file path for typos",
+    "Ensure the file hasn't been moved or deleted",
+    "Verify you have read permissions for the file"
+)
+_DIRECTORY_NOT_FOUND_ACTIONS = (
+    "Check the directory path for typos",
+    "Create the directory manually",
+    "Use a different output directory"
+)
+_DIRECTORY_PERMISSION_ACTIONS = (
+    "Check write permissions for the parent directory",
+    "Run as administrator if necessary",
+    "Choose a different directory"
+)
+_NO_MATCHES_ACTIONS = (
+    "Check the glob pattern syntax",
+    "Verify files exist in the specified location",
+    "Use absolute paths if relative paths aren't working"
+)
+
+
+def _stat_is_file(path_str: str) -> bool:
+    """Stat a path and report whether it is a regular file; missing paths raise OSError."""
+    return stat.S_ISREG(os.stat(path_str).st_mode)
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_count() -> int:
+    """Logical CPU count, looked up once per process."""
+    return os.cpu_count() or 1
+
+
+# Plain decimal strings such as "-10" or "2.5" convert without a try/except round trip
+_PLAIN_DECIMAL = re.compile(r'-?\d+(?:\.\d+)?\Z')
+
+# scheme://netloc for the common case; anything unusual falls back to urlparse
+_URL_HEAD = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*)://([^/?#\[\]\s]*)(?=[/?#]|$)')
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_video_file(validator: type, path: Union[str, Path], field_name: str,
+                       mtime_ns: int, size: int) -> Path:
+    """Memoized PathValidator._validate_video_file; invalid files raise and are not cached.
+    
+    The file's mtime and size are part of the key, so a replaced file is validated again.
+    """
+    return validator._validate_video_file(path, field_name)
+
+
+_SEPARATORS = os.sep + (os.altsep or '')
+
+
+def _ext(path: str) -> str:
+    """Path(path).suffix for a plain string, without building a Path."""
+    name = path.rstrip(_SEPARATORS)
+    name = name[max(name.rfind(sep) for sep in _SEPARATORS) + 1:]
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+
+def clear_validation_cache():
+    """Forget cached filesystem checks and memoized parameter validations."""
+    _cached_video_file.cache_clear()
+    _validate_analysis_parameters.cache_clear()
+
+
 class Validator:
     """Base validator class with common validation methods."""
     
     @staticmethod
     def is_not_empty(value: Any, field_name: str = "value") -> Any:
         """Validate that a value is not empty or None."""
-        if value is None or (isinstance(value, str) and not value.strip()):
+        # isspace() answers the blank check without allocating a stripped copy
+        if value is None or (isinstance(value, str) and (not value or value.isspace())):
             raise ValidationError(f"{field_name} cannot be empty", field=field_name)
         return value
     
@@ -32,7 +104,15 @@ class Validator:
     @staticmethod
     def is_number(value: Any, field_name: str = "value") -> Union[int, float]:
         """Validate that a value is a number."""
+        value_type = type(value)
+        if value_type is int or value_type is float:
+            return value
+        if value_type is str and _PLAIN_DECIMAL.match(value):
+            return float(value)
+        if value is None:
+            raise ValidationError(f"{field_name} must be a number", field=field_name)
         if not isinstance(value, (int, float)):
+            # Anything else (exponents, inf, padded strings, Decimal...) is left to float()
             try:
                 return float(value)
             except (ValueError, TypeError):
@@ -62,8 +142,11 @@ class Validator:
         return value
     
     @staticmethod
-    def is_in_choices(value: Any, choices: List[Any], field_name: str = "value") -> Any:
-        """Validate that a value is in a list of allowed choices."""
+    def is_in_choices(value: Any, choices: Collection[Any], field_name: str = "value") -> Any:
+        """Validate that a value is in a collection of allowed choices.
+        
+        Pass a set or frozenset for constant-time membership on large choice lists.
+        """
         if value not in choices:
             raise ValidationError(
                 f"{field_name} must be one of: {', '.join(map(str, choices))}",
@@ -75,14 +158,27 @@ class Validator:
 class PathValidator(Validator):
     """Validator for file and directory paths."""
     
-    SUPPORTED_VIDEO_EXTENSIONS = {
+    SUPPORTED_VIDEO_EXTENSIONS = frozenset({
         '.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v',
         '.mpg', '.mpeg', '.3gp', '.asf', '.rm', '.rmvb', '.ts', '.mts'
-    }
+    })
     
-    SUPPORTED_AUDIO_EXTENSIONS = {
+    SUPPORTED_AUDIO_EXTENSIONS = frozenset({
         '.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'
-    }
+    })
+    
+    # Listings for error messages, built once
+    _VIDEO_EXTENSIONS_TEXT = ', '.join(sorted(SUPPORTED_VIDEO_EXTENSIONS))
+    _AUDIO_EXTENSIONS_TEXT = ', '.join(sorted(SUPPORTED_AUDIO_EXTENSIONS))
+    
+    _VIDEO_FORMAT_ACTIONS = (
+        f"Use one of the supported formats: {_VIDEO_EXTENSIONS_TEXT}",
+        "Convert the video to a supported format"
+    )
+    _AUDIO_FORMAT_ACTIONS = (
+        f"Use one of the supported formats: {_AUDIO_EXTENSIONS_TEXT}",
+        "Convert the audio to a supported format"
+    )
     
     @classmethod
     def validate_file_path(
@@ -100,18 +196,19 @@ class PathValidator(Validator):
             raise ValidationError(f"Invalid path format: {e}", field=field_name)
         
         if must_exist:
-            if not path_obj.exists():
+            try:
+                is_file = _stat_is_file(str(path_obj))
+            except (OSError, ValueError):
+                is_file = None
+            
+            if is_file is None:
                 raise FileSystemError(
                     f"File does not exist: {path}",
                     path=str(path),
-                    suggested_actions=[
-                        "Check the file path for typos",
-                        "Ensure the file hasn't been moved or deleted",
-                        "Verify you have read permissions for the file"
-                    ]
+                    suggested_actions=_FILE_NOT_FOUND_ACTIONS
                 )
             
-            if not path_obj.is_file():
+            if not is_file:
                 raise FileSystemError(
                     f"Path exists but is not a file: {path}",
                     path=str(path)
@@ -135,8 +232,13 @@ class PathValidator(Validator):
         except Exception as e:
             raise ValidationError(f"Invalid path format: {e}", field=field_name)
         
-        if path_obj.exists():
-            if not path_obj.is_dir():
+        try:
+            is_dir = stat.S_ISDIR(os.stat(path_obj).st_mode)
+        except (OSError, ValueError):
+            is_dir = None
+        
+        if is_dir is not None:
+            if not is_dir:
                 raise FileSystemError(
                     f"Path exists but is not a directory: {path}",
                     path=str(path)
@@ -145,11 +247,7 @@ class PathValidator(Validator):
             raise FileSystemError(
                 f"Directory does not exist: {path}",
                 path=str(path),
-                suggested_actions=[
-                    "Check the directory path for typos",
-                    "Create the directory manually",
-                    "Use a different output directory"
-                ]
+                suggested_actions=_DIRECTORY_NOT_FOUND_ACTIONS
             )
         elif create_if_missing:
             try:
@@ -158,11 +256,7 @@ class PathValidator(Validator):
                 raise FileSystemError(
                     f"Permission denied creating directory: {path}",
                     path=str(path),
-                    suggested_actions=[
-                        "Check write permissions for the parent directory",
-                        "Run as administrator if necessary",
-                        "Choose a different directory"
-                    ]
+                    suggested_actions=_DIRECTORY_PERMISSION_ACTIONS
                 )
             except Exception as e:
                 raise FileSystemError(
@@ -178,20 +272,35 @@ class PathValidator(Validator):
         path: Union[str, Path],
         field_name: str = "video_file"
     ) -> Path:
-        """Validate a video file path."""
-        path_obj = cls.validate_file_path(path, must_exist=True, field_name=field_name)
+        """Validate a video file path.
         
-        if path_obj.suffix.lower() not in cls.SUPPORTED_VIDEO_EXTENSIONS:
+        Verdicts for str and Path inputs are memoized while the file's mtime
+        and size stay the same; missing files always take the uncached path.
+        """
+        if isinstance(path, (str, Path)):
+            try:
+                st = os.stat(path)
+            except (OSError, ValueError):
+                st = None
+            if st is not None:
+                return _cached_video_file(cls, path, field_name, st.st_mtime_ns, st.st_size)
+        return cls._validate_video_file(path, field_name)
+    
+    @classmethod
+    def _validate_video_file(cls, path: Union[str, Path], field_name: str) -> Path:
+        path_obj = cls.validate_file_path(path, must_exist=True, field_name=field_name)
+        cls._validate_video_extension(path_obj.suffix, field_name)
+        return path_obj
+    
+    @classmethod
+    def _validate_video_extension(cls, suffix: str, field_name: str = "video_file") -> None:
+        """Check a video file suffix without touching the filesystem."""
+        if classify_media_extension(suffix) != 'video':
             raise ValidationError(
-                f"Unsupported video format: {path_obj.suffix}",
+                f"Unsupported video format: {suffix}",
                 field=field_name,
-                suggested_actions=[
-                    f"Use one of the supported formats: {', '.join(sorted(cls.SUPPORTED_VIDEO_EXTENSIONS))}",
-                    "Convert the video to a supported format"
-                ]
+                suggested_actions=cls._VIDEO_FORMAT_ACTIONS
             )
-        
-        return path_obj
     
     @classmethod
     def validate_audio_file(
@@ -202,22 +311,68 @@ class PathValidator(Validator):
         """Validate an audio file path."""
         path_obj = cls.validate_file_path(path, must_exist=True, field_name=field_name)
         
-        if path_obj.suffix.lower() not in cls.SUPPORTED_AUDIO_EXTENSIONS:
+        suffix = path_obj.suffix
+        if classify_media_extension(suffix) != 'audio':
             raise ValidationError(
-                f"Unsupported audio format: {path_obj.suffix}",
+                f"Unsupported audio format: {suffix}",
                 field=field_name,
-                suggested_actions=[
-                    f"Use one of the supported formats: {', '.join(sorted(cls.SUPPORTED_AUDIO_EXTENSIONS))}",
-                    "Convert the audio to a supported format"
-                ]
+                suggested_actions=cls._AUDIO_FORMAT_ACTIONS
             )
         
         return path_obj
 
 
+# Extension -> media kind, shared by the video and audio checks
+_EXT_KIND = {
+    **dict.fromkeys(PathValidator.SUPPORTED_VIDEO_EXTENSIONS, 'video'),
+    **dict.fromkeys(PathValidator.SUPPORTED_AUDIO_EXTENSIONS, 'audio'),
+}
+
+
+def classify_media_extension(suffix: str) -> Optional[str]:
+    """Return 'video' or 'audio' for a supported file suffix, else None."""
+    # Most suffixes are already lowercase; only fold case when the exact lookup misses
+    return _EXT_KIND.get(suffix) or _EXT_KIND.get(suffix.lower())
+
+
+# name -> (min, max, cast, range message, suggested actions)
+_PARAM_SPECS = {
+    # Reasonable range for audio decibel thresholds
+    'decibel_threshold': (
+        -60.0, 20.0, float,
+        "Decibel threshold should be between -60.0 and 20.0 dB",
+        (
+            "Use the 'reference' command to analyze your video and get recommended thresholds",
+            "Typical values: -10 dB (balanced), -5 dB (aggressive), -15 dB (conservative)"
+        )
+    ),
+    # Reasonable range for clip lengths: 5 seconds to 5 minutes
+    'clip_length': (
+        5, 300, int,
+        "Clip length should be between 5 and 300 seconds",
+        (
+            "Use 30 seconds for typical gaming highlights",
+            "Use 60-120 seconds for longer narrative moments",
+            "Use 10-15 seconds for quick reaction clips"
+        )
+    ),
+}
+
+
 class ConfigValidator(Validator):
     """Validator for configuration and parameter values."""
     
+    @classmethod
+    def _validate_param(cls, name: str, value: Any, field_name: str) -> Union[int, float]:
+        """Check a numeric parameter against its _PARAM_SPECS entry."""
+        min_val, max_val, cast, message, actions = _PARAM_SPECS[name]
+        value = cls.is_number(value, field_name)
+        
+        if not (min_val <= value <= max_val):
+            raise ValidationError(message, field=field_name, suggested_actions=actions)
+        
+        return cast(value)
+    
     @classmethod
     def validate_decibel_threshold(
         cls, 
@@ -225,20 +380,7 @@ class ConfigValidator(Validator):
         field_name: str = "decibel_threshold"
     ) -> float:
         """Validate decibel threshold parameter."""
-        threshold = cls.is_number(threshold, field_name)
-        
-        # Reasonable range for audio decibel thresholds
-        if not (-60.0 <= threshold <= 20.0):
-            raise ValidationError(
-                f"Decibel threshold should be between -60.0 and 20.0 dB",
-                field=field_name,
-                suggested_actions=[
-                    "Use the 'reference' command to analyze your video and get recommended thresholds",
-                    "Typical values: -10 dB (balanced), -5 dB (aggressive), -15 dB (conservative)"
-                ]
-            )
-        
-        return float(threshold)
+        return cls._validate_param('decibel_threshold', threshold, field_name)
     
     @classmethod
     def validate_clip_length(
@@ -247,22 +389,7 @@ class ConfigValidator(Validator):
         field_name: str = "clip_length"
     ) -> int:
         """Validate clip length parameter."""
-        length = cls.is_number(length, field_name)
-        length = cls.is_positive(length, field_name)
-        
-        # Reasonable range for clip lengths
-        if not (5 <= length <= 300):  # 5 seconds to 5 minutes
-            raise ValidationError(
-                f"Clip length should be between 5 and 300 seconds",
-                field=field_name,
-                suggested_actions=[
-                    "Use 30 seconds for typical gaming highlights",
-                    "Use 60-120 seconds for longer narrative moments",
-                    "Use 10-15 seconds for quick reaction clips"
-                ]
-            )
-        
-        return int(length)
+        return cls._validate_param('clip_length', length, field_name)
     
     @classmethod
     def validate_worker_count(
@@ -274,17 +401,16 @@ class ConfigValidator(Validator):
         workers = cls.is_number(workers, field_name)
         workers = cls.is_positive(workers, field_name)
         
-        import psutil
-        cpu_count = psutil.cpu_count()
+        cpu_count = _cpu_count()
         
         if workers > cpu_count * 2:
             raise ValidationError(
                 f"Worker count ({workers}) is too high for your system ({cpu_count} CPUs)",
                 field=field_name,
-                suggested_actions=[
+                suggested_actions=(
                     f"Use at most {cpu_count} workers for optimal performance",
                     f"Consider {max(1, cpu_count // 2)} for balanced system usage"
-                ]
+                )
             )
         
         return int(workers)
@@ -304,21 +430,27 @@ class NetworkValidator(Validator):
         cls.is_not_empty(url, field_name)
         cls.is_string(url, field_name)
         
-        try:
-            parsed = urlparse(url)
-        except Exception as e:
-            raise ValidationError(f"Invalid URL format: {e}", field=field_name)
+        head = _URL_HEAD.match(url)
+        if head is not None:
+            # urlparse lowercases the scheme, so match that here
+            scheme, netloc = head.group(1).lower(), head.group(2)
+        else:
+            try:
+                parsed = urlparse(url)
+            except Exception as e:
+                raise ValidationError(f"Invalid URL format: {e}", field=field_name)
+            scheme, netloc = parsed.scheme, parsed.netloc
         
-        if not parsed.scheme:
+        if not scheme:
             raise ValidationError("URL must include a scheme (http, https, etc.)", field=field_name)
         
-        if allowed_schemes and parsed.scheme not in allowed_schemes:
+        if allowed_schemes and scheme not in allowed_schemes:
             raise ValidationError(
                 f"URL scheme must be one of: {', '.join(allowed_schemes)}",
                 field=field_name
             )
         
-        if not parsed.netloc:
+        if not netloc:
             raise ValidationError("URL must include a domain name", field=field_name)
         
         return url
@@ -338,21 +470,38 @@ def validate_output_directory(output_path: Union[str, Path], create: bool = True
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _validate_analysis_parameters(decibel_threshold, clip_length, workers):
+    """Validate a parameter set once; failures raise and are not cached."""
+    check = ConfigValidator._validate_param
+    validated = (
+        ('decibel_threshold', check('decibel_threshold', decibel_threshold, 'decibel_threshold')),
+        ('clip_length', check('clip_length', clip_length, 'clip_length')),
+    )
+    
+    if workers is not None:
+        validated += (('workers', ConfigValidator.validate_worker_count(workers)),)
+    
+    return validated
+
+
 def validate_analysis_parameters(
     decibel_threshold: Union[int, float],
     clip_length: Union[int, float],
     workers: Optional[Union[int, float]] = None
 ) -> Dict[str, Union[int, float]]:
-    """Validate analysis parameters."""
-    validated = {
-        'decibel_threshold': ConfigValidator.validate_decibel_threshold(decibel_threshold),
-        'clip_length': ConfigValidator.validate_clip_length(clip_length)
-    }
+    """Validate analysis parameters.
     
-    if workers is not None:
-        validated['workers'] = ConfigValidator.validate_worker_count(workers)
-    
-    return validated
+    The same parameters are usually applied to every video in a batch, so
+    results are memoized and a fresh dict is returned for each caller.
+    """
+    try:
+        hash((decibel_threshold, clip_length, workers))
+    except TypeError:
+        # Unhashable values can't be memoized; validate them directly so they
+        # are rejected with a ValidationError
+        return dict(_validate_analysis_parameters.__wrapped__(decibel_threshold, clip_length, workers))
+    return dict(_validate_analysis_parameters(decibel_threshold, clip_length, workers))
 
 
 def validate_batch_input(
@@ -361,29 +510,27 @@ def validate_batch_input(
     **analysis_params
 ) -> Dict[str, Any]:
     """Validate batch processing inputs."""
-    import glob
-    
     # Validate pattern produces results
-    if not video_pattern.strip():
+    if not video_pattern or video_pattern.isspace():
         raise ValidationError("Video pattern cannot be empty", field="video_pattern")
     
-    video_files = glob.glob(video_pattern)
+    if any(c in video_pattern for c in '*?['):
+        video_files = glob.glob(video_pattern)
+    else:
+        # A plain path needs one existence check, not a directory walk
+        video_files = [video_pattern] if os.path.lexists(video_pattern) else []
     if not video_files:
         raise ValidationError(
             f"No video files found matching pattern: {video_pattern}",
             field="video_pattern",
-            suggested_actions=[
-                "Check the glob pattern syntax",
-                "Verify files exist in the specified location",
-                "Use absolute paths if relative paths aren't working"
-            ]
+            suggested_actions=_NO_MATCHES_ACTIONS
         )
     
-    # Validate each found file
+    # Validate each found file; matches already exist, so only the extension is checked
     for video_file in video_files[:5]:  # Check first 5 for efficiency
         try:
-            PathValidator.validate_video_file(video_file)
-        except (ValidationError, FileSystemError) as e:
+            PathValidator._validate_video_extension(_ext(video_file))
+        except ValidationError as e:
             raise ValidationError(
                 f"Invalid video file in pattern: {video_file} - {e}",
                 field="video_pattern"
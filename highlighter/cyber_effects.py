@@ -6,15 +6,89 @@ Includes holographic effects, scanning lines, particle systems, and glitch trans
 
 import tkinter as tk
 from tkinter import Canvas
+import itertools
 import math
-import random
-import threading
 import time
-from typing import List, Tuple, Optional
+import weakref
+from typing import Callable, Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+from loguru import logger
 
-@dataclass
+# Numba is optional; without it the particle step runs as NumPy vector ops
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Shared generator so effects can draw their random numbers in batches
+_RNG = np.random.default_rng()
+
+
+def _named_font(widget: tk.Misc, name: str, **options) -> str:
+    """Register a named Tk font once per interpreter and return its name.
+    
+    Items that reference a font by name skip re-parsing a font description.
+    Created through Tcl directly so no Python Font object owns its lifetime.
+    """
+    if name not in widget.tk.splitlist(widget.tk.call("font", "names")):
+        args = []
+        for key, value in options.items():
+            args += ("-" + key, value)
+        widget.tk.call("font", "create", name, *args)
+    return name
+
+
+def _step_particles_numpy(xs, ys, vxs, vys, sizes, lives, color_idx, n, width, height):
+    """Move, age and cull the first n particles in place; returns how many survive."""
+    x, y, vy, life = xs[:n], ys[:n], vys[:n], lives[:n]
+    x += vxs[:n]
+    y += vy
+    life -= 0.02
+    vy += 0.1
+    
+    # Keep alive particles, compacting them to the front of the arrays
+    alive = (life > 0) & (x >= 0) & (x <= width) & (y >= 0) & (y <= height)
+    k = int(np.count_nonzero(alive))
+    if k < n:
+        for arr in (xs, ys, vxs, vys, sizes, lives, color_idx):
+            arr[:k] = arr[:n][alive]
+    return k
+
+
+if NUMBA_AVAILABLE:
+    # An explicit signature compiles the kernel at import (and loads it from
+    # the on-disk cache afterwards) instead of on the first particle frame,
+    # which usually lands on a hover event
+    @njit(
+        "int64(float32[::1], float32[::1], float32[::1], float32[::1], float32[::1],"
+        " float32[::1], int32[::1], int64, float64, float64)",
+        cache=True, fastmath=True
+    )
+    def _step_particles(xs, ys, vxs, vys, sizes, lives, color_idx, n, width, height):
+        """Compiled _step_particles_numpy: one fused pass, no temporary mask."""
+        k = 0
+        for i in range(n):
+            x = xs[i] + vxs[i]
+            y = ys[i] + vys[i]
+            life = lives[i] - 0.02
+            if life > 0 and 0 <= x <= width and 0 <= y <= height:
+                xs[k] = x
+                ys[k] = y
+                vxs[k] = vxs[i]
+                vys[k] = vys[i] + 0.1
+                sizes[k] = sizes[i]
+                lives[k] = life
+                color_idx[k] = color_idx[i]
+                k += 1
+        return k
+else:
+    _step_particles = _step_particles_numpy
+
+
+@dataclass(slots=True)
 class Particle:
     """Data class for particle effects."""
     x: float
@@ -27,9 +101,106 @@ class Particle:
     life: float
 
 
+class EffectScheduler:
+    """Drives every running effect of a Tk application from one after() chain.
+    
+    Effects register a step callback with their frame interval; each tick runs
+    the callbacks that are due and sleeps until the next one is.
+    """
+    
+    # Tk root -> active scheduler; entries go away with their root
+    _schedulers: "weakref.WeakKeyDictionary[tk.Misc, EffectScheduler]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, root: tk.Misc):
+        # Weak, so the registry value does not keep its own key alive
+        self._root_ref = weakref.ref(root)
+        self._subs: Dict[Callable[[], None], List[float]] = {}  # callback -> [interval, due]
+        self._after_id = None
+    
+    @property
+    def root(self) -> Optional[tk.Misc]:
+        """The Tk root this scheduler draws on, or None once it was collected."""
+        return self._root_ref()
+    
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "EffectScheduler":
+        """Return the scheduler shared by everything under widget's Tk root."""
+        root = widget._root()
+        scheduler = cls._schedulers.get(root)
+        if scheduler is None:
+            scheduler = cls._schedulers[root] = cls(root)
+        return scheduler
+    
+    def register(self, callback: Callable[[], None], interval_ms: int):
+        """Call callback every interval_ms until it is unregistered."""
+        interval = interval_ms / 1000
+        self._subs[callback] = [interval, time.monotonic() + interval]
+        self._schedule()
+    
+    def unregister(self, callback: Callable[[], None]):
+        """Stop calling callback; retires the scheduler when nothing is left."""
+        self._subs.pop(callback, None)
+        if self._subs:
+            return
+        
+        root = self.root
+        if self._after_id is not None and root is not None:
+            try:
+                root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass  # Root already destroyed
+        self._after_id = None
+        self._retire()
+    
+    def _retire(self):
+        """Drop this scheduler from the registry if it is still the active one."""
+        root = self.root
+        if root is not None and self._schedulers.get(root) is self:
+            del self._schedulers[root]
+    
+    def _schedule(self):
+        if self._after_id is not None or not self._subs:
+            return
+        
+        root = self.root
+        delay = min(due for _, due in self._subs.values()) - time.monotonic()
+        if root is not None:
+            try:
+                self._after_id = root.after(max(1, math.ceil(delay * 1000)), self._tick)
+                return
+            except tk.TclError:
+                pass
+        
+        # Root was destroyed; nothing can be drawn any more
+        self._subs.clear()
+        self._retire()
+    
+    def _tick(self):
+        self._after_id = None
+        now = time.monotonic()
+        
+        for callback, slot in list(self._subs.items()):
+            if slot[1] <= now and callback in self._subs:
+                slot[1] = now + slot[0]
+                try:
+                    callback()
+                except tk.TclError:
+                    # The effect's widget is gone
+                    self._subs.pop(callback, None)
+                except Exception:
+                    # A broken effect must not stop every other effect on this root
+                    logger.exception(f"effect step {callback!r} failed; unregistering it")
+                    self._subs.pop(callback, None)
+        
+        self._schedule()
+
+
 class HolographicScanline:
     """Holographic scanning line effect for glassmorphism panels."""
     
+    # Frames between color changes; must be a power of two
+    COLOR_PERIOD = 8
+    
     def __init__(self, canvas: Canvas, width: int, height: int, colors: List[str]):
         self.canvas = canvas
         self.width = width
@@ -40,38 +211,41 @@ class HolographicScanline:
         self.speed = 2
         self.is_running = False
         self.line_id = None
+        self._color_cycle = itertools.cycle(colors)
+        self._frame = 0
         
     def start(self):
         """Start the scanning animation."""
         self.is_running = True
+        if not self.line_id:
+            self.line_id = self.canvas.create_line(
+                0, self.position,
+                self.width, self.position,
+                fill=next(self._color_cycle),
+                width=3,
+                smooth=True
+            )
         self.animate()
+        EffectScheduler.for_widget(self.canvas).register(self.animate, 50)
     
     def stop(self):
         """Stop the scanning animation."""
         self.is_running = False
+        EffectScheduler.for_widget(self.canvas).unregister(self.animate)
         if self.line_id:
             self.canvas.delete(self.line_id)
+            self.line_id = None
     
     def animate(self):
         """Animate the scanning line."""
         if not self.is_running:
             return
-            
-        # Clear previous line
-        if self.line_id:
-            self.canvas.delete(self.line_id)
         
-        # Create gradient effect
-        color = random.choice(self.colors)
-        
-        # Draw scanning line with opacity effect
-        self.line_id = self.canvas.create_line(
-            0, self.position,
-            self.width, self.position,
-            fill=color,
-            width=3,
-            smooth=True
-        )
+        # Move the line; the color steps through the palette every few frames
+        self.canvas.coords(self.line_id, 0, self.position, self.width, self.position)
+        if self._frame & (self.COLOR_PERIOD - 1) == 0:
+            self.canvas.itemconfigure(self.line_id, fill=next(self._color_cycle))
+        self._frame += 1
         
         # Update position
         self.position += self.speed * self.direction
@@ -79,111 +253,173 @@ class HolographicScanline:
         # Bounce at edges
         if self.position >= self.height or self.position <= 0:
             self.direction *= -1
-        
-        # Schedule next frame
-        self.canvas.after(50, self.animate)
 
 
 class ParticleSystem:
-    """Particle system for cyberpunk effects."""
+    """Particle system for cyberpunk effects.
+    
+    Particle state is kept as parallel NumPy arrays so each frame's motion,
+    ageing and culling run as a handful of vector operations.
+    """
+    
+    # Hard cap on live particles; keeps memory and per-frame work bounded
+    MAX_PARTICLES = 512
     
     def __init__(self, canvas: Canvas, width: int, height: int):
         self.canvas = canvas
         self.width = width
         self.height = height
-        self.particles: List[Particle] = []
         self.is_running = False
-        self.particle_ids = []
+        self.particle_ids = []  # Every pooled oval item, reused across frames
+        # Opaque and stippled particles draw from separate pools so an item's
+        # stipple is fixed when it is created and never has to be resent
+        self._pools = ([], [])  # (opaque, stippled) oval items
+        self._pool_colors = ([], [])  # Color index last applied per pool item
+        self._visible = [0, 0]  # Leading items shown in each pool
         
+        # Struct-of-arrays particle state; only the first `count` slots are live
+        self.count = 0
+        self.xs = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.ys = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.vxs = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.vys = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.sizes = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.lives = np.empty(self.MAX_PARTICLES, dtype=np.float32)
+        self.color_idx = np.empty(self.MAX_PARTICLES, dtype=np.int32)
+        self._palette: List[str] = []
+        self._palette_index: Dict[str, int] = {}
+    
+    @property
+    def particles(self) -> List[Particle]:
+        """Snapshot of the live particles."""
+        n = self.count
+        return [
+            Particle(x, y, vx, vy, size, self._palette[c], max(0.0, life), life)
+            for x, y, vx, vy, size, c, life in zip(
+                self.xs[:n].tolist(), self.ys[:n].tolist(),
+                self.vxs[:n].tolist(), self.vys[:n].tolist(),
+                self.sizes[:n].tolist(), self.color_idx[:n].tolist(),
+                self.lives[:n].tolist()
+            )
+        ]
+    
     def add_particle(self, x: float, y: float, color: str = "#FFFFFF"):
-        """Add a new particle to the system."""
-        particle = Particle(
-            x=x,
-            y=y,
-            vx=random.uniform(-2, 2),
-            vy=random.uniform(-3, -1),
-            size=random.uniform(1, 3),
-            color=color,
-            alpha=1.0,
-            life=1.0
-        )
-        self.particles.append(particle)
+        """Add a new particle to the system; ignored once MAX_PARTICLES are alive."""
+        if self.count >= self.MAX_PARTICLES:
+            return
+        
+        c = self._palette_index.get(color)
+        if c is None:
+            c = self._palette_index[color] = len(self._palette)
+            self._palette.append(color)
+        
+        i = self.count
+        self.xs[i] = x
+        self.ys[i] = y
+        self.vxs[i], self.vys[i], self.sizes[i] = _RNG.uniform((-2, -3, 1), (2, -1, 3))
+        self.lives[i] = 1.0
+        self.color_idx[i] = c
+        self.count = i + 1
     
     def start(self):
         """Start the particle system."""
         self.is_running = True
         self.update()
+        EffectScheduler.for_widget(self.canvas).register(self.update, 33)  # ~30 FPS
     
     def stop(self):
         """Stop the particle system."""
         self.is_running = False
+        EffectScheduler.for_widget(self.canvas).unregister(self.update)
         for particle_id in self.particle_ids:
             self.canvas.delete(particle_id)
         self.particle_ids.clear()
-        self.particles.clear()
+        for pool, pool_colors in zip(self._pools, self._pool_colors):
+            pool.clear()
+            pool_colors.clear()
+        self._visible = [0, 0]
+        self.count = 0
     
     def update(self):
         """Update all particles."""
         if not self.is_running:
             return
-            
-        # Clear previous particles
-        for particle_id in self.particle_ids:
-            self.canvas.delete(particle_id)
-        self.particle_ids.clear()
         
-        # Update and draw particles
-        alive_particles = []
+        # Move, age, apply gravity and cull every particle at once
+        k = self.count = _step_particles(
+            self.xs, self.ys, self.vxs, self.vys, self.sizes, self.lives, self.color_idx,
+            self.count, float(self.width), float(self.height)
+        )
         
-        for particle in self.particles:
-            # Update position
-            particle.x += particle.vx
-            particle.y += particle.vy
-            
-            # Update life and alpha
-            particle.life -= 0.02
-            particle.alpha = max(0, particle.life)
-            
-            # Apply gravity
-            particle.vy += 0.1
-            
-            # Keep alive particles
-            if particle.life > 0 and 0 <= particle.x <= self.width and 0 <= particle.y <= self.height:
-                alive_particles.append(particle)
-                
-                # Draw particle
-                particle_id = self.canvas.create_oval(
-                    particle.x - particle.size,
-                    particle.y - particle.size,
-                    particle.x + particle.size,
-                    particle.y + particle.size,
-                    fill=particle.color,
-                    outline="",
-                    stipple="gray50" if particle.alpha < 0.5 else ""
-                )
-                self.particle_ids.append(particle_id)
-        
-        self.particles = alive_particles
+        # Alpha is max(0, life), so low-life particles are drawn stippled
+        stippled = self.lives[:k] < 0.5
+        for pool, mask in enumerate((~stippled, stippled)):
+            self._draw_pool(
+                pool, self.xs[:k][mask], self.ys[:k][mask],
+                self.sizes[:k][mask], self.color_idx[:k][mask]
+            )
         
         # Add new particles occasionally
-        if random.random() < 0.1:
+        spawn_roll, x_frac, color_roll = _RNG.random(3).tolist()
+        if spawn_roll < 0.1:
             self.add_particle(
-                random.uniform(0, self.width),
+                x_frac * self.width,
                 self.height + 10,
-                random.choice(["#FFFFFF", "#E0E0E0", "#CCCCCC"])
+                ("#FFFFFF", "#E0E0E0", "#CCCCCC")[int(color_roll * 3)]
+            )
+    
+    def _draw_pool(self, pool: int, xs: np.ndarray, ys: np.ndarray,
+                   sizes: np.ndarray, color_idx: np.ndarray):
+        """Draw one stipple group of particles with the matching item pool."""
+        # Bind hot attributes to locals for the per-particle loop. Item updates
+        # go straight to the canvas command: the Canvas.coords/itemconfigure
+        # wrappers cost several times the Tcl call itself.
+        tk_call = self.canvas.tk.call
+        path = self.canvas._w
+        items = self._pools[pool]
+        item_colors = self._pool_colors[pool]
+        palette = self._palette
+        k = len(xs)
+        
+        # Grow the pool if needed, then move and recolor existing items
+        # instead of deleting and recreating them every frame
+        while len(items) < k:
+            item = self.canvas.create_oval(
+                0, 0, 0, 0, outline="", stipple="gray50" if pool else "", state="hidden"
             )
+            items.append(item)
+            item_colors.append(None)
+            self.particle_ids.append(item)
         
-        # Schedule next frame
-        self.canvas.after(33, self.update)  # ~30 FPS
+        # Fill is only resent when a pool item takes over a different color
+        for i, (item, x, y, size, c) in enumerate(zip(
+            items, xs.tolist(), ys.tolist(), sizes.tolist(), color_idx.tolist()
+        )):
+            tk_call(path, "coords", item, x - size, y - size, x + size, y + size)
+            if item_colors[i] != c:
+                if item_colors[i] is None:
+                    tk_call(path, "itemconfigure", item, "-fill", palette[c], "-state", "normal")
+                else:
+                    tk_call(path, "itemconfigure", item, "-fill", palette[c])
+                item_colors[i] = c
+        
+        # Hide pool items no longer needed this frame
+        for i in range(k, self._visible[pool]):
+            tk_call(path, "itemconfigure", items[i], "-state", "hidden")
+            item_colors[i] = None
+        self._visible[pool] = k
 
 
 class GlitchEffect:
     """Digital glitch effect for cyberpunk aesthetics."""
     
+    GLITCH_COLORS = ("#FF0000", "#00FF00", "#0000FF", "#FFFFFF", "#000000")
+    
     def __init__(self, widget: tk.Widget):
         self.widget = widget
         self.original_colors = {}
         self.is_glitching = False
+        self._schedule: List[Dict[str, str]] = []  # configure() options per frame
         
     def start_glitch(self, duration: float = 1.0):
         """Start glitch effect."""
@@ -202,7 +438,40 @@ class GlitchEffect:
             pass
         
         # Start glitch animation
-        self.glitch_frame(0, int(duration * 30))  # 30 FPS
+        self._frame = 0
+        self._total_frames = int(duration * 30)  # 30 FPS
+        self._schedule = self._build_schedule(self._total_frames)
+        self._advance()
+        if self.is_glitching:
+            EffectScheduler.for_widget(self.widget).register(self._advance, 33)
+    
+    def _build_schedule(self, total_frames: int) -> List[Dict[str, str]]:
+        """Roll every frame of the glitch up front.
+        
+        Each frame has a 30% chance of random colors; the rest restore the
+        originals. Restore frames share one dict so repeats are easy to skip.
+        """
+        restore = {key: value for key, value in self.original_colors.items() if value}
+        has_fg = bool(self.original_colors.get('fg'))
+        
+        glitching = (_RNG.random(total_frames) < 0.3).tolist()
+        picks = _RNG.integers(0, len(self.GLITCH_COLORS), size=(total_frames, 2)).tolist()
+        
+        schedule = []
+        for glitch, (bg_pick, fg_pick) in zip(glitching, picks):
+            if glitch:
+                options = {'bg': self.GLITCH_COLORS[bg_pick]}
+                if has_fg:
+                    options['fg'] = self.GLITCH_COLORS[fg_pick]
+                schedule.append(options)
+            else:
+                schedule.append(restore)
+        return schedule
+    
+    def _advance(self):
+        """Scheduler step: show the next glitch frame."""
+        self.glitch_frame(self._frame, self._total_frames)
+        self._frame += 1
     
     def glitch_frame(self, current_frame: int, total_frames: int):
         """Animate a single glitch frame."""
@@ -210,34 +479,21 @@ class GlitchEffect:
             self.stop_glitch()
             return
         
-        # Random glitch colors
-        glitch_colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFFFF", "#000000"]
+        options = self._schedule[current_frame]
         
-        if random.random() < 0.3:  # 30% chance of glitch
-            try:
-                glitch_bg = random.choice(glitch_colors)
-                self.widget.configure(bg=glitch_bg)
-                
-                if self.original_colors.get('fg'):
-                    glitch_fg = random.choice(glitch_colors)
-                    self.widget.configure(fg=glitch_fg)
-            except:
-                pass
-        else:
-            # Restore original colors occasionally
-            try:
-                self.widget.configure(bg=self.original_colors['bg'])
-                if self.original_colors.get('fg'):
-                    self.widget.configure(fg=self.original_colors['fg'])
-            except:
-                pass
+        # Consecutive restore frames would repaint the same colors
+        if current_frame and options is self._schedule[current_frame - 1]:
+            return
         
-        # Schedule next frame
-        self.widget.after(33, lambda: self.glitch_frame(current_frame + 1, total_frames))
+        try:
+            self.widget.configure(**options)
+        except:
+            pass
     
     def stop_glitch(self):
         """Stop glitch effect and restore original appearance."""
         self.is_glitching = False
+        EffectScheduler.for_widget(self.widget).unregister(self._advance)
         
         try:
             self.widget.configure(bg=self.original_colors['bg'])
@@ -247,6 +503,10 @@ class GlitchEffect:
             pass
 
 
+# Start angles for the indeterminate ring: 36 steps of 10 degrees
+_RING_ANGLES = tuple(range(0, 360, 10))
+
+
 class CyberProgressRing:
     """Cyberpunk-style circular progress indicator."""
     
@@ -257,9 +517,15 @@ class CyberProgressRing:
         self.progress = 0.0
         self.is_indeterminate = False
         self.rotation = 0
-        self._animation_id = None  # Track animation callbacks
+        self._rotation_step = 0  # Index into _RING_ANGLES
         self._is_destroyed = False  # Track widget destruction
         
+        # Canvas items, created on the first draw and updated in place afterwards
+        self._ring_id = None
+        self._arc_id = None
+        self._glow_id = None
+        self._arc_shape = None  # (extent, state) last applied to the arcs
+        
         # Create canvas
         self.canvas = Canvas(
             parent,
@@ -291,7 +557,8 @@ class CyberProgressRing:
     def set_progress(self, value: float):
         """Set progress value (0.0 to 1.0)."""
         self.progress = max(0.0, min(1.0, value))
-        self.is_indeterminate = False
+        if self.is_indeterminate:
+            self.stop_animation()
         self.draw()
     
     def set_indeterminate(self, enabled: bool = True):
@@ -299,18 +566,15 @@ class CyberProgressRing:
         self.is_indeterminate = enabled
         if enabled:
             self.animate_indeterminate()
+            if self.is_indeterminate and not self._is_destroyed:
+                EffectScheduler.for_widget(self.canvas).register(self.animate_indeterminate, 50)
         else:
             self.stop_animation()
     
     def stop_animation(self):
         """Stop any running animations and clean up resources."""
         self.is_indeterminate = False
-        if self._animation_id:
-            try:
-                self.canvas.after_cancel(self._animation_id)
-            except tk.TclError:
-                pass  # Widget already destroyed
-            self._animation_id = None
+        EffectScheduler.for_widget(self.canvas).unregister(self.animate_indeterminate)
     
     def destroy(self):
         """Destroy the progress ring and clean up all resources."""
@@ -321,24 +585,48 @@ class CyberProgressRing:
         except tk.TclError:
             pass  # Already destroyed
     
-    def draw(self):
-        """Draw the progress ring."""
-        self.canvas.delete("all")
-        
+    def _create_items(self):
+        """Create the ring and arc items that draw() reconfigures."""
         center = self.size // 2
         radius = (self.size - self.thickness) // 2
+        bbox = (center - radius, center - radius, center + radius, center + radius)
         
-        # Draw background ring
-        self.canvas.create_oval(
-            center - radius,
-            center - radius,
-            center + radius,
-            center + radius,
+        # Background ring
+        self._ring_id = self.canvas.create_oval(
+            *bbox,
             outline=self.bg_color,
             width=self.thickness,
             fill=""
         )
         
+        # Main progress arc
+        self._arc_id = self.canvas.create_arc(
+            *bbox,
+            start=0,
+            extent=0,
+            outline=self.progress_color,
+            width=self.thickness,
+            style="arc",
+            state="hidden"
+        )
+        
+        # Glow effect
+        if self.thickness > 4:
+            self._glow_id = self.canvas.create_arc(
+                *bbox,
+                start=0,
+                extent=0,
+                outline=self.glow_color,
+                width=max(1, self.thickness // 4),
+                style="arc",
+                state="hidden"
+            )
+    
+    def draw(self):
+        """Draw the progress ring."""
+        if self._ring_id is None:
+            self._create_items()
+        
         if self.is_indeterminate:
             # Draw animated arc for indeterminate mode
             start_angle = self.rotation
@@ -348,41 +636,20 @@ class CyberProgressRing:
             start_angle = -90  # Start at top
             extent = 360 * self.progress
         
-        if extent > 0:
-            # Main progress arc
-            self.canvas.create_arc(
-                center - radius,
-                center - radius,
-                center + radius,
-                center + radius,
-                start=start_angle,
-                extent=extent,
-                outline=self.progress_color,
-                width=self.thickness,
-                style="arc"
-            )
-            
-            # Glow effect
-            if self.thickness > 4:
-                self.canvas.create_arc(
-                    center - radius,
-                    center - radius,
-                    center + radius,
-                    center + radius,
-                    start=start_angle,
-                    extent=extent,
-                    outline=self.glow_color,
-                    width=max(1, self.thickness // 4),
-                    style="arc"
-                )
+        # Indeterminate frames only rotate the arc, so usually just the start angle is sent
+        shape = (extent, "normal" if extent > 0 else "hidden")
+        if shape != self._arc_shape:
+            self._arc_shape = shape
+            options = {'start': start_angle, 'extent': extent, 'state': shape[1]}
+        else:
+            options = {'start': start_angle}
+        
+        self.canvas.itemconfigure(self._arc_id, **options)
+        if self._glow_id is not None:
+            self.canvas.itemconfigure(self._glow_id, **options)
     
     def animate_indeterminate(self):
         """Animate indeterminate progress."""
-        # Clear any existing animation callback
-        if self._animation_id:
-            self.canvas.after_cancel(self._animation_id)
-            self._animation_id = None
-            
         if not self.is_indeterminate or self._is_destroyed:
             return
             
@@ -390,17 +657,16 @@ class CyberProgressRing:
             # Check if canvas still exists
             if not self.canvas.winfo_exists():
                 self._is_destroyed = True
+                self.stop_animation()
                 return
                 
-            self.rotation = (self.rotation + 10) % 360
+            self._rotation_step = (self._rotation_step + 1) % len(_RING_ANGLES)
+            self.rotation = _RING_ANGLES[self._rotation_step]
             self.draw()
-            
-            # Schedule next frame with proper cleanup tracking
-            self._animation_id = self.canvas.after(50, self.animate_indeterminate)
         except tk.TclError:
             # Widget was destroyed
             self._is_destroyed = True
-            self._animation_id = None
+            self.stop_animation()
 
 
 class MatrixRain:
@@ -411,32 +677,53 @@ class MatrixRain:
         self.width = width
         self.height = height
         self.columns = width // 20
+        self.rows = height // 20  # Drops past this row are below the canvas
+        self._row_color = self._build_row_colors()
         self.drops = [0] * self.columns
+        self.glyph_ids = []  # One reusable text item per column
+        self.glyph_colors = []  # Fill last applied to each column's item; None while hidden
         self.is_running = False
-        self._animation_id = None  # Track animation callbacks
         self._is_destroyed = False  # Track widget destruction
         
         # Matrix characters
         self.chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@#$%^&*()_+-=[]{}|;:,.<>?"
+    
+    def _build_row_colors(self) -> List[Optional[str]]:
+        """Fade color for each on-screen drop row; None where the glyph is hidden."""
+        row_colors = []
+        for row in range(self.rows + 1):
+            y = row * 20
+            if y >= self.height:
+                row_colors.append(None)
+                continue
+            
+            # Color based on position (fade effect)
+            alpha = max(0.1, 1.0 - (y / self.height))
+            if alpha > 0.7:
+                row_colors.append("#FFFFFF")
+            elif alpha > 0.4:
+                row_colors.append("#CCCCCC")
+            else:
+                row_colors.append("#666666")
+        return row_colors
         
     def start(self):
         """Start the matrix rain effect."""
         self.is_running = True
         self.animate()
+        if self.is_running and not self._is_destroyed:
+            EffectScheduler.for_widget(self.canvas).register(self.animate, 100)
     
     def stop(self):
         """Stop the matrix rain effect."""
         self.is_running = False
         
         # Cancel any pending animation callbacks
-        if self._animation_id:
-            try:
-                self.canvas.after_cancel(self._animation_id)
-            except tk.TclError:
-                pass  # Widget already destroyed
-            self._animation_id = None
+        EffectScheduler.for_widget(self.canvas).unregister(self.animate)
             
         # Clean up matrix elements
+        self.glyph_ids.clear()
+        self.glyph_colors.clear()
         try:
             self.canvas.delete("matrix")
         except tk.TclError:
@@ -449,11 +736,6 @@ class MatrixRain:
     
     def animate(self):
         """Animate the matrix rain."""
-        # Clear any existing animation callback
-        if self._animation_id:
-            self.canvas.after_cancel(self._animation_id)
-            self._animation_id = None
-            
         if not self.is_running or self._is_destroyed:
             return
             
@@ -461,52 +743,79 @@ class MatrixRain:
             # Check if canvas still exists
             if not self.canvas.winfo_exists():
                 self._is_destroyed = True
+                EffectScheduler.for_widget(self.canvas).unregister(self.animate)
                 return
                 
-            # Clear previous frame
-            self.canvas.delete("matrix")
+            # Create the per-column text items once at their drop positions;
+            # later frames scroll them with move() and reconfigure them
+            if not self.glyph_ids:
+                font = _named_font(self.canvas, "CyberMono", family="Courier", size=12, weight="bold")
+                self.glyph_ids = [
+                    self.canvas.create_text(
+                        i * 20, self.drops[i] * 20,
+                        text="",
+                        font=font,
+                        tags="matrix",
+                        state="hidden"
+                    )
+                    for i in range(self.columns)
+                ]
+                self.glyph_colors = [None] * self.columns
+            
+            # Draw the frame's random characters and reset rolls in one go
+            char_idx = _RNG.integers(0, len(self.chars), size=self.columns).tolist()
+            resets = (_RNG.random(self.columns) > 0.975).tolist()
+            
+            # Bind hot attributes to locals for the per-column loop; as in
+            # ParticleSystem, item updates bypass the Canvas wrappers
+            tk_call = self.canvas.tk.call
+            path = self.canvas._w
+            chars = self.chars
+            drops = self.drops
+            glyph_ids = self.glyph_ids
+            glyph_colors = self.glyph_colors
+            rows = self.rows
+            row_color = self._row_color
             
             # Draw falling characters
+            reset_columns = []
             for i in range(self.columns):
-                # Random character
-                char = random.choice(self.chars)
+                # Off-screen drops just wait for their restart roll; they stop
+                # advancing so their counters stay bounded
+                if drops[i] > rows:
+                    if glyph_colors[i] is not None:
+                        glyph_colors[i] = None
+                        tk_call(path, "itemconfigure", glyph_ids[i], "-state", "hidden")
+                    if resets[i]:
+                        drops[i] = 0
+                        reset_columns.append(i)
+                    continue
                 
-                # Position
-                x = i * 20
-                y = self.drops[i] * 20
-                
-                # Color based on position (fade effect)
-                if y < self.height:
-                    alpha = max(0.1, 1.0 - (y / self.height))
-                    
-                    if alpha > 0.7:
-                        color = "#FFFFFF"
-                    elif alpha > 0.4:
-                        color = "#CCCCCC"
-                    else:
-                        color = "#666666"
-                    
-                    # Draw character
-                    self.canvas.create_text(
-                        x, y,
-                        text=char,
-                        fill=color,
-                        font=("Courier", 12, "bold"),
-                        tags="matrix"
+                # Draw character; the fill only changes when the drop crosses a tier,
+                # so most frames send just the new text
+                color = row_color[drops[i]]
+                if color is None:
+                    if glyph_colors[i] is not None:
+                        glyph_colors[i] = None
+                        tk_call(path, "itemconfigure", glyph_ids[i], "-state", "hidden")
+                elif color != glyph_colors[i]:
+                    glyph_colors[i] = color
+                    tk_call(
+                        path, "itemconfigure", glyph_ids[i],
+                        "-text", chars[char_idx[i]], "-fill", color, "-state", "normal"
                     )
-                
-                # Update drop position
-                if y > self.height and random.random() > 0.975:
-                    self.drops[i] = 0
                 else:
-                    self.drops[i] += 1
+                    tk_call(path, "itemconfigure", glyph_ids[i], "-text", chars[char_idx[i]])
+                drops[i] += 1
             
-            # Schedule next frame with proper cleanup tracking
-            self._animation_id = self.canvas.after(100, self.animate)
+            # Advance every drop with one move, then send restarted columns back to the top
+            self.canvas.move("matrix", 0, 20)
+            for i in reset_columns:
+                tk_call(path, "coords", glyph_ids[i], i * 20, 0)
         except tk.TclError:
             # Widget was destroyed
             self._is_destroyed = True
-            self._animation_id = None
+            EffectScheduler.for_widget(self.canvas).unregister(self.animate)
 
 
 class CyberEnhancedWidget:
@@ -519,44 +828,66 @@ class CyberEnhancedWidget:
         self.glitch = None
         self.canvas_overlay = None
         
-    def add_scanline_effect(self, colors: List[str] = None):
-        """Add holographic scanline effect."""
-        if colors is None:
-            colors = ["#FFFFFF", "#E0E0E0", "#CCCCCC"]
+        # Track the widget size from <Configure> rather than forcing a
+        # synchronous geometry pass with update_idletasks on every effect
+        self._width = widget.winfo_width()
+        self._height = widget.winfo_height()
+        self._pending_effects: List[Callable[[], None]] = []
+        widget.bind("<Configure>", self._on_configure, add="+")
+    
+    def _has_size(self) -> bool:
+        # Unmapped widgets report 1x1 until they are first laid out
+        return self._width > 1 and self._height > 1
+    
+    def _on_configure(self, event):
+        """Cache the new size and start effects that were waiting for it."""
+        self._width = event.width
+        self._height = event.height
+        if self._pending_effects and self._has_size():
+            pending, self._pending_effects = self._pending_effects, []
+            for start in pending:
+                start()
+        
+    def _show_overlay(self) -> Canvas:
+        """Show the overlay canvas, creating it on first use.
         
-        # Create overlay canvas
+        The overlay outlives stop_all_effects so hover-driven effects reuse
+        one canvas instead of building and destroying a widget every time.
+        """
         if not self.canvas_overlay:
             self.canvas_overlay = Canvas(
                 self.widget,
                 highlightthickness=0,
                 bg=""
             )
-            self.canvas_overlay.place(relwidth=1, relheight=1)
+        self.canvas_overlay.place(relwidth=1, relheight=1)
+        return self.canvas_overlay
+    
+    def add_scanline_effect(self, colors: List[str] = None):
+        """Add holographic scanline effect."""
+        if colors is None:
+            colors = ["#FFFFFF", "#E0E0E0", "#CCCCCC"]
         
-        # Get widget dimensions
-        self.widget.update_idletasks()
-        width = self.widget.winfo_width()
-        height = self.widget.winfo_height()
+        if not self._has_size():
+            self._pending_effects.append(lambda: self.add_scanline_effect(colors))
+            return
         
-        self.scanline = HolographicScanline(self.canvas_overlay, width, height, colors)
+        overlay = self._show_overlay()
+        if self.scanline:
+            self.scanline.stop()
+        self.scanline = HolographicScanline(overlay, self._width, self._height, colors)
         self.scanline.start()
     
     def add_particle_effect(self):
         """Add particle system effect."""
-        if not self.canvas_overlay:
-            self.canvas_overlay = Canvas(
-                self.widget,
-                highlightthickness=0,
-                bg=""
-            )
-            self.canvas_overlay.place(relwidth=1, relheight=1)
-        
-        # Get widget dimensions
-        self.widget.update_idletasks()
-        width = self.widget.winfo_width()
-        height = self.widget.winfo_height()
+        if not self._has_size():
+            self._pending_effects.append(self.add_particle_effect)
+            return
         
-        self.particles = ParticleSystem(self.canvas_overlay, width, height)
+        overlay = self._show_overlay()
+        if self.particles:
+            self.particles.stop()
+        self.particles = ParticleSystem(overlay, self._width, self._height)
         self.particles.start()
     
     def add_glitch_effect(self, duration: float = 1.0):
@@ -568,6 +899,8 @@ class CyberEnhancedWidget:
     
     def stop_all_effects(self):
         """Stop all cyber effects."""
+        self._pending_effects.clear()
+        
         if self.scanline:
             self.scanline.stop()
         
@@ -577,9 +910,9 @@ class CyberEnhancedWidget:
         if self.glitch:
             self.glitch.stop_glitch()
         
+        # Effects delete their own items; just hide the overlay for reuse
         if self.canvas_overlay:
-            self.canvas_overlay.destroy()
-            self.canvas_overlay = None
+            self.canvas_overlay.place_forget()
 
 
 class CyberBackground:
@@ -604,6 +937,7 @@ class CyberBackground:
         self.particles = ParticleSystem(self.canvas, width, height)
         
         self.is_active = False
+        self._start_ids = []  # Pending delayed effect starts
     
     def place(self, **kwargs):
         """Place the background canvas."""
@@ -615,8 +949,10 @@ class CyberBackground:
         
         # Start matrix rain with delay using after() method instead of threads
         if hasattr(self.canvas, 'after'):
-            self.canvas.after(1000, self.matrix.start)  # 1 second delay
-            self.canvas.after(2000, self.particles.start)  # 2 second delay
+            self._start_ids = [
+                self.canvas.after(1000, self.matrix.start),  # 1 second delay
+                self.canvas.after(2000, self.particles.start)  # 2 second delay
+            ]
         else:
             # Fallback for testing
             self.matrix.start()
@@ -625,6 +961,15 @@ class CyberBackground:
     def stop_effects(self):
         """Stop all background effects."""
         self.is_active = False
+        
+        # Drop delayed starts that have not fired yet
+        for after_id in self._start_ids:
+            try:
+                self.canvas.after_cancel(after_id)
+            except tk.TclError:
+                pass  # Widget already destroyed
+        self._start_ids.clear()
+        
         if hasattr(self, 'matrix'):
             self.matrix.stop()
         if hasattr(self, 'particles'):
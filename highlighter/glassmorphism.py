@@ -9,11 +9,28 @@ from tkinter import ttk
 import threading
 import time
 import math
-from typing import Dict, Tuple, Optional, Callable, List
-from dataclasses import dataclass
+import weakref
+from array import array
+from functools import lru_cache
+from typing import Dict, Tuple, Optional, Callable, List, Set
+from dataclasses import dataclass, fields
 
 
-@dataclass
+def _blend_rgb(src: int, dst: int, amount: int) -> int:
+    """Blend two packed 0xRRGGBB colors, amount/255 of the way from src to dst.
+    
+    Red and blue share one integer multiply and green gets another, with
+    Blinn's (i + (i >> 8)) >> 8 standing in for a rounded division by 255.
+    """
+    inverse = 255 - amount
+    rb = (src & 0xFF00FF) * inverse + (dst & 0xFF00FF) * amount + 0x800080
+    rb = ((rb + ((rb >> 8) & 0xFF00FF)) >> 8) & 0xFF00FF
+    g = (src & 0x00FF00) * inverse + (dst & 0x00FF00) * amount + 0x008000
+    g = ((g + ((g >> 8) & 0x00FF00)) >> 8) & 0x00FF00
+    return rb | g
+
+
+@dataclass(frozen=True, slots=True)
 class GlassmorphismColors:
     """Ultra-modern black and white glassmorphism color palette."""
     
@@ -70,13 +87,48 @@ class GlassmorphismColors:
     accent_primary: str = "#F5F5F5"
     accent_secondary: str = "#E0E0E0"
     accent_tertiary: str = "#CCCCCC"
+    
+    def rgba(self, base: str, alpha: str) -> str:
+        """8-digit hex for a glass color at an alpha level, e.g. rgba('glass_primary', 'alpha_30')."""
+        return _rgba_table(self)[base, alpha][0]
+    
+    def blended(self, base: str, alpha: str) -> str:
+        """Tk-displayable 6-digit hex of rgba() composited over deep_black."""
+        return _rgba_table(self)[base, alpha][1]
+
+
+@lru_cache(maxsize=4)
+def _rgba_table(colors: GlassmorphismColors) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """Map (glass_*, alpha_*) to ("#RRGGBBAA", "#RRGGBB" composited over deep_black)."""
+    names = [f.name for f in fields(colors)]
+    backdrop = int(colors.deep_black[1:], 16)
+    
+    table = {}
+    for base in names:
+        if not base.startswith('glass_'):
+            continue
+        color = getattr(colors, base)
+        for alpha in names:
+            if alpha.startswith('alpha_'):
+                level = getattr(colors, alpha)
+                over = _blend_rgb(backdrop, int(color[1:], 16), int(level, 16))
+                table[base, alpha] = (color + level, '#%06X' % over)
+    return table
+
+
+# Shared palette; it is immutable, so every theme can use the same instance
+COLORS = GlassmorphismColors()
+
+
+# Samples per easing curve in GlassmorphismTheme.easing_tables, minus one
+EASING_STEPS = 1023
 
 
 class GlassmorphismTheme:
     """Main theme controller for glassmorphism aesthetics."""
     
     def __init__(self):
-        self.colors = GlassmorphismColors()
+        self.colors = COLORS
         self.animation_speed = 200  # milliseconds
         self.blur_radius = 20
         self.border_radius = 12
@@ -100,180 +152,237 @@ class GlassmorphismTheme:
             'ease_in_out': lambda t: 3 * t ** 2 - 2 * t ** 3 if t < 0.5 else 1 - ((-2 * t + 2) ** 3) / 2,
             'elastic': lambda t: (2 ** (-10 * t)) * math.sin((t - 0.1) * (2 * math.pi) / 0.4) + 1,
         }
+        
+        # Sampled curves for per-frame animation; index with round(t * EASING_STEPS)
+        self.easing_tables = {
+            name: array('d', [fn(i / EASING_STEPS) for i in range(EASING_STEPS + 1)])
+            for name, fn in self.easing.items()
+        }
     
     def create_glass_style(self, style: ttk.Style) -> None:
         """Configure comprehensive glassmorphism styles for ttk widgets."""
-        
+        commands = _style_commands(self.colors, tuple(self.fonts.items()))
+        
+        # Styles belong to the interpreter's current theme; skip the Tcl round
+        # trips when this spec is already installed there
+        theme_name = style.theme_use()
+        applied = _applied_styles.setdefault(style.master, {})
+        if applied.get(theme_name) is commands:
+            return
+        
+        # Preformatted ttk::style commands skip ttk.Style's option formatting
+        call = style.tk.call
+        for command in commands:
+            call(*command)
+        applied[theme_name] = commands
+
+
+# Style specs already installed, per Tk root and ttk theme
+_applied_styles: "weakref.WeakKeyDictionary[tk.Misc, Dict[str, tuple]]" = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=8)
+def _style_spec(colors: GlassmorphismColors, font_items: tuple) -> Tuple[tuple, tuple]:
+    """Build the (configure, map) style tables for a palette and font set.
+    
+    Returns:
+        tuple: ((style_name, options), ...) pairs for style.configure and style.map.
+    """
+    fonts = dict(font_items)
+    
+    configure_spec = (
         # Glass Frame Styles
-        style.configure(
-            'Glass.TFrame',
-            background=self.colors.glass_primary,
-            relief='flat',
-            borderwidth=1,
-            bordercolor=self.colors.border_subtle
-        )
-        
-        style.configure(
-            'GlassSecondary.TFrame',
-            background=self.colors.glass_secondary,
-            relief='flat',
-            borderwidth=1,
-            bordercolor=self.colors.border_medium
-        )
+        ('Glass.TFrame', {
+            'background': colors.glass_primary,
+            'relief': 'flat',
+            'borderwidth': 1,
+            'bordercolor': colors.border_subtle,
+        }),
+        ('GlassSecondary.TFrame', {
+            'background': colors.glass_secondary,
+            'relief': 'flat',
+            'borderwidth': 1,
+            'bordercolor': colors.border_medium,
+        }),
         
         # Glass Button Styles
-        style.configure(
-            'Glass.TButton',
-            background=self.colors.glass_primary,
-            foreground=self.colors.pure_white,
-            borderwidth=1,
-            bordercolor=self.colors.border_subtle,
-            relief='flat',
-            font=self.fonts['body'],
-            padding=(16, 8),
-            focuscolor='none'
-        )
-        
-        style.map(
-            'Glass.TButton',
-            background=[
-                ('active', self.colors.glass_hover),
-                ('pressed', self.colors.glass_active),
-                ('disabled', self.colors.glass_secondary)
-            ],
-            bordercolor=[
-                ('active', self.colors.border_medium),
-                ('pressed', self.colors.border_bright),
-                ('focus', self.colors.border_highlight)
-            ]
-        )
+        ('Glass.TButton', {
+            'background': colors.glass_primary,
+            'foreground': colors.pure_white,
+            'borderwidth': 1,
+            'bordercolor': colors.border_subtle,
+            'relief': 'flat',
+            'font': fonts['body'],
+            'padding': (16, 8),
+            'focuscolor': 'none',
+        }),
         
         # Primary Action Button
-        style.configure(
-            'GlassPrimary.TButton',
-            background=self.colors.pure_white,
-            foreground=self.colors.pure_black,
-            borderwidth=0,
-            relief='flat',
-            font=self.fonts['heading'],
-            padding=(20, 12),
-            focuscolor='none'
-        )
-        
-        style.map(
-            'GlassPrimary.TButton',
-            background=[
-                ('active', self.colors.ice_white),
-                ('pressed', self.colors.silver_white),
-                ('disabled', self.colors.muted_white)
-            ]
-        )
+        ('GlassPrimary.TButton', {
+            'background': colors.pure_white,
+            'foreground': colors.pure_black,
+            'borderwidth': 0,
+            'relief': 'flat',
+            'font': fonts['heading'],
+            'padding': (20, 12),
+            'focuscolor': 'none',
+        }),
         
         # Glass Entry Styles
-        style.configure(
-            'Glass.TEntry',
-            fieldbackground=self.colors.glass_secondary,
-            foreground=self.colors.pure_white,
-            borderwidth=1,
-            bordercolor=self.colors.border_subtle,
-            relief='flat',
-            insertcolor=self.colors.pure_white,
-            font=self.fonts['body']
-        )
-        
-        style.map(
-            'Glass.TEntry',
-            fieldbackground=[
-                ('focus', self.colors.glass_tertiary),
-                ('readonly', self.colors.glass_primary)
-            ],
-            bordercolor=[
-                ('focus', self.colors.border_bright),
-                ('invalid', self.colors.error)
-            ]
-        )
+        ('Glass.TEntry', {
+            'fieldbackground': colors.glass_secondary,
+            'foreground': colors.pure_white,
+            'borderwidth': 1,
+            'bordercolor': colors.border_subtle,
+            'relief': 'flat',
+            'insertcolor': colors.pure_white,
+            'font': fonts['body'],
+        }),
         
         # Glass Label Styles
-        style.configure(
-            'GlassTitle.TLabel',
-            background=self.colors.deep_black,
-            foreground=self.colors.pure_white,
-            font=self.fonts['title']
-        )
-        
-        style.configure(
-            'GlassSubtitle.TLabel',
-            background=self.colors.deep_black,
-            foreground=self.colors.soft_white,
-            font=self.fonts['subtitle']
-        )
-        
-        style.configure(
-            'GlassHeading.TLabel',
-            background=self.colors.glass_primary,
-            foreground=self.colors.pure_white,
-            font=self.fonts['heading']
-        )
-        
-        style.configure(
-            'GlassBody.TLabel',
-            background=self.colors.glass_primary,
-            foreground=self.colors.ice_white,
-            font=self.fonts['body']
-        )
-        
-        style.configure(
-            'GlassCaption.TLabel',
-            background=self.colors.glass_primary,
-            foreground=self.colors.muted_white,
-            font=self.fonts['caption']
-        )
+        ('GlassTitle.TLabel', {
+            'background': colors.deep_black,
+            'foreground': colors.pure_white,
+            'font': fonts['title'],
+        }),
+        ('GlassSubtitle.TLabel', {
+            'background': colors.deep_black,
+            'foreground': colors.soft_white,
+            'font': fonts['subtitle'],
+        }),
+        ('GlassHeading.TLabel', {
+            'background': colors.glass_primary,
+            'foreground': colors.pure_white,
+            'font': fonts['heading'],
+        }),
+        ('GlassBody.TLabel', {
+            'background': colors.glass_primary,
+            'foreground': colors.ice_white,
+            'font': fonts['body'],
+        }),
+        ('GlassCaption.TLabel', {
+            'background': colors.glass_primary,
+            'foreground': colors.muted_white,
+            'font': fonts['caption'],
+        }),
         
         # Glass LabelFrame Styles
-        style.configure(
-            'Glass.TLabelframe',
-            background=self.colors.glass_primary,
-            borderwidth=1,
-            bordercolor=self.colors.border_subtle,
-            relief='flat'
-        )
-        
-        style.configure(
-            'Glass.TLabelframe.Label',
-            background=self.colors.glass_primary,
-            foreground=self.colors.pure_white,
-            font=self.fonts['heading']
-        )
+        ('Glass.TLabelframe', {
+            'background': colors.glass_primary,
+            'borderwidth': 1,
+            'bordercolor': colors.border_subtle,
+            'relief': 'flat',
+        }),
+        ('Glass.TLabelframe.Label', {
+            'background': colors.glass_primary,
+            'foreground': colors.pure_white,
+            'font': fonts['heading'],
+        }),
         
         # Glass Scale Styles
-        style.configure(
-            'Glass.Horizontal.TScale',
-            background=self.colors.glass_primary,
-            troughcolor=self.colors.glass_secondary,
-            borderwidth=0,
-            sliderlength=20,
-            sliderrelief='flat'
-        )
+        ('Glass.Horizontal.TScale', {
+            'background': colors.glass_primary,
+            'troughcolor': colors.glass_secondary,
+            'borderwidth': 0,
+            'sliderlength': 20,
+            'sliderrelief': 'flat',
+        }),
         
         # Glass Progressbar Styles
-        style.configure(
-            'Glass.Horizontal.TProgressbar',
-            background=self.colors.pure_white,
-            troughcolor=self.colors.glass_secondary,
-            borderwidth=0,
-            lightcolor=self.colors.pure_white,
-            darkcolor=self.colors.pure_white
-        )
+        ('Glass.Horizontal.TProgressbar', {
+            'background': colors.pure_white,
+            'troughcolor': colors.glass_secondary,
+            'borderwidth': 0,
+            'lightcolor': colors.pure_white,
+            'darkcolor': colors.pure_white,
+        }),
         
         # Glass Scrollbar Styles
-        style.configure(
-            'Glass.Vertical.TScrollbar',
-            background=self.colors.glass_secondary,
-            troughcolor=self.colors.glass_primary,
-            borderwidth=0,
-            arrowcolor=self.colors.pure_white,
-            relief='flat'
-        )
+        ('Glass.Vertical.TScrollbar', {
+            'background': colors.glass_secondary,
+            'troughcolor': colors.glass_primary,
+            'borderwidth': 0,
+            'arrowcolor': colors.pure_white,
+            'relief': 'flat',
+        }),
+    )
+    
+    map_spec = (
+        ('Glass.TButton', {
+            'background': [
+                ('active', colors.glass_hover),
+                ('pressed', colors.glass_active),
+                ('disabled', colors.glass_secondary),
+            ],
+            'bordercolor': [
+                ('active', colors.border_medium),
+                ('pressed', colors.border_bright),
+                ('focus', colors.border_highlight),
+            ],
+        }),
+        ('GlassPrimary.TButton', {
+            'background': [
+                ('active', colors.ice_white),
+                ('pressed', colors.silver_white),
+                ('disabled', colors.muted_white),
+            ],
+        }),
+        ('Glass.TEntry', {
+            'fieldbackground': [
+                ('focus', colors.glass_tertiary),
+                ('readonly', colors.glass_primary),
+            ],
+            'bordercolor': [
+                ('focus', colors.border_bright),
+                ('invalid', colors.error),
+            ],
+        }),
+    )
+    
+    return configure_spec, map_spec
+
+
+@lru_cache(maxsize=8)
+def _style_commands(colors: GlassmorphismColors, font_items: tuple) -> Tuple[tuple, ...]:
+    """Flatten _style_spec into ready-to-call ttk::style argument tuples.
+    
+    Equivalent to what ttk.Style.configure/map would send for the same
+    options: each option becomes a -name value pair, and each map option a
+    flat state/value list.
+    """
+    configure_spec, map_spec = _style_spec(colors, font_items)
+    commands = []
+    
+    for name, options in configure_spec:
+        args = ['ttk::style', 'configure', name]
+        for option, value in options.items():
+            args += ('-' + option, value)
+        commands.append(tuple(args))
+    
+    for name, options in map_spec:
+        args = ['ttk::style', 'map', name]
+        for option, statespecs in options.items():
+            args += ('-' + option, tuple(item for statespec in statespecs for item in statespec))
+        commands.append(tuple(args))
+    
+    return tuple(commands)
+
+
+# Tk roots that already route <Map> events to _tag_mapped_widget
+_glass_panel_roots: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+
+
+def _tag_mapped_widget(event):
+    """Give a newly mapped widget the hover bindtag of every enclosing GlassPanel."""
+    widget = event.widget
+    if not isinstance(widget, tk.Misc):
+        return
+    
+    ancestor = widget.master
+    while ancestor is not None:
+        if isinstance(ancestor, GlassPanel):
+            ancestor.add_hover_tag(widget)
+        ancestor = ancestor.master
 
 
 class GlassPanel(tk.Frame):
@@ -329,26 +438,49 @@ class GlassPanel(tk.Frame):
             self.title_label.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 10))
     
     def bind_hover_events(self):
-        """Bind hover events for glass effects."""
-        def on_enter(event):
-            self.is_hovered = True
-            self.animate_hover(True)
-            
-        def on_leave(event):
-            self.is_hovered = False
-            self.animate_hover(False)
-            
-        self.bind("<Enter>", on_enter)
-        self.bind("<Leave>", on_leave)
-        
-        # Bind to all child widgets recursively
-        def bind_children(widget):
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            for child in widget.winfo_children():
-                bind_children(child)
-        
-        bind_children(self.content_frame)
+        """Bind hover events for glass effects.
+        
+        The handlers are bound once to a bindtag shared by the panel and its
+        content, instead of separately on every descendant widget.
+        """
+        self._hover_tag = f"GlassPanel{id(self)}"
+        self._hover_bindings = [
+            (sequence, self.bind_class(self._hover_tag, sequence, handler))
+            for sequence, handler in (("<Enter>", self._on_hover_enter),
+                                      ("<Leave>", self._on_hover_leave))
+        ]
+        
+        self.add_hover_tag(self)
+        self.add_hover_tag(self.content_frame)
+        
+        # Everything else inside the panel, including widgets added later,
+        # is tagged as it gets mapped rather than by walking the subtree
+        root = self._root()
+        if root not in _glass_panel_roots:
+            root.bind_all("<Map>", _tag_mapped_widget, add="+")
+            _glass_panel_roots.add(root)
+    
+    def add_hover_tag(self, widget: tk.Widget):
+        """Make a widget trigger this panel's hover effect."""
+        tags = widget.bindtags()
+        if self._hover_tag not in tags:
+            widget.bindtags((self._hover_tag,) + tags)
+    
+    def _on_hover_enter(self, event):
+        self.is_hovered = True
+        self.animate_hover(True)
+    
+    def _on_hover_leave(self, event):
+        self.is_hovered = False
+        self.animate_hover(False)
+    
+    def destroy(self):
+        """Destroy the panel and release its class-level hover bindings."""
+        for sequence, funcid in getattr(self, '_hover_bindings', ()):
+            self.unbind_class(self._hover_tag, sequence)
+            self.deletecommand(funcid)
+        self._hover_bindings = []
+        super().destroy()
     
     def animate_hover(self, hover_in: bool):
         """Animate hover state changes."""
@@ -369,6 +501,22 @@ class GlassPanel(tk.Frame):
         self.after(50, transition)
 
 
+# Tk roots that already have the GlassButton class bindings
+_glass_button_roots: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+
+
+def _dispatch_button_event(event, sequence: str, handler_name: str):
+    """Forward a GlassButton bindtag event to the button's handler.
+    
+    A binding made directly on the button for the same sequence replaces the
+    built-in handler, as it did when the handlers were instance bindings.
+    """
+    # event.widget is left as a path string when the widget is already gone
+    button = event.widget
+    if isinstance(button, GlassButton) and not button.bind(sequence):
+        getattr(button, handler_name)(event)
+
+
 class GlassButton(tk.Button):
     """Advanced glass button with hover animations and effects."""
     
@@ -411,12 +559,33 @@ class GlassButton(tk.Button):
         self.bind_events()
         self.create_ripple_effect()
     
+    # Events bound once per application on the GlassButton bindtag
+    _CLASS_EVENTS = (
+        ("<Enter>", "on_enter"),
+        ("<Leave>", "on_leave"),
+        ("<Button-1>", "on_press"),
+        ("<ButtonRelease-1>", "on_release"),
+    )
+    
     def bind_events(self):
-        """Bind interactive events."""
-        self.bind("<Enter>", self.on_enter)
-        self.bind("<Leave>", self.on_leave)
-        self.bind("<Button-1>", self.on_press)
-        self.bind("<ButtonRelease-1>", self.on_release)
+        """Bind interactive events.
+        
+        Handlers live on a shared GlassButton bindtag and dispatch to the
+        button under the event, so each button only needs the tag added.
+        """
+        root = self._root()
+        if root not in _glass_button_roots:
+            for sequence, handler_name in self._CLASS_EVENTS:
+                root.bind_class(
+                    "GlassButton", sequence,
+                    lambda event, seq=sequence, name=handler_name:
+                        _dispatch_button_event(event, seq, name)
+                )
+            _glass_button_roots.add(root)
+        
+        # Keep instance bindings first and Tk's Button class bindings after ours
+        tags = self.bindtags()
+        self.bindtags(tags[:1] + ("GlassButton",) + tags[1:])
     
     def on_enter(self, event):
         """Handle mouse enter."""
@@ -467,44 +636,123 @@ class GlassButton(tk.Button):
         pass
 
 
+def _color_to_int(widget: tk.Widget, color: str) -> int:
+    """Pack a Tk color into a 0xRRGGBB integer."""
+    if len(color) == 7 and color[0] == '#':
+        try:
+            return int(color[1:], 16)
+        except ValueError:
+            pass
+    
+    # Named, short or 16-bit colors; let Tk resolve them
+    r, g, b = widget.winfo_rgb(color)
+    return (r >> 8) << 16 | (g >> 8) << 8 | b >> 8
+
+
+@dataclass
+class _Animation:
+    """A running AnimationManager animation, advanced by the shared tick."""
+    widget: tk.Widget
+    start: float  # time.monotonic() when the animation began
+    duration: float  # seconds
+    curve: array  # sampled easing from GlassmorphismTheme.easing_tables
+    apply: Callable[[float], None]  # receives the eased progress (0.0 to 1.0)
+    callback: Optional[Callable] = None
+
+
 class AnimationManager:
-    """Manages smooth animations for glassmorphism UI elements."""
+    """Manages smooth animations for glassmorphism UI elements.
+    
+    All running animations are advanced from a single ~60 Hz after() loop by
+    elapsed time, rather than one after() chain per animation step.
+    """
+    
+    FRAME_INTERVAL = 16  # milliseconds between shared ticks
     
     def __init__(self, theme: GlassmorphismTheme):
         self.theme = theme
-        self.running_animations = {}
+        self.running_animations: Set[int] = set()  # ids of widgets fading or sliding
+        self._morph_running: Set[int] = set()  # ids of widgets morphing color
+        self._animations: Dict[Tuple[int, bool], _Animation] = {}  # (widget id, is morph)
+        self._tick_root: Optional[tk.Misc] = None  # root the pending tick is scheduled on
+        self._tick_after_id: Optional[str] = None
+    
+    def _running(self, morph: bool) -> Set[int]:
+        return self._morph_running if morph else self.running_animations
+    
+    def _start(self, widget: tk.Widget, duration: int, easing: str,
+               apply: Callable[[float], None], callback: Optional[Callable] = None,
+               morph: bool = False):
+        """Register an animation and make sure the shared tick is running."""
+        self._running(morph).add(id(widget))
+        self._animations[id(widget), morph] = _Animation(
+            widget, time.monotonic(), max(duration, 1) / 1000,
+            self.theme.easing_tables[easing], apply, callback
+        )
+        self._ensure_tick()
+    
+    def _ensure_tick(self):
+        """Schedule the next shared tick on the Tk root of a live animated widget."""
+        if self._tick_after_id is not None:
+            try:
+                # Raises if the pending tick went away with a destroyed root
+                self._tick_root.tk.call('after', 'info', self._tick_after_id)
+                return
+            except tk.TclError:
+                self._tick_root = self._tick_after_id = None
+        
+        for key, animation in list(self._animations.items()):
+            try:
+                # Scheduled on the root, so destroying the animated widget
+                # does not cancel the tick for everything else
+                root = animation.widget._root()
+                self._tick_after_id = root.after(self.FRAME_INTERVAL, self._tick)
+                self._tick_root = root
+                return
+            except tk.TclError:
+                # Widget destroyed; nothing left to animate there
+                del self._animations[key]
+                self._running(key[1]).discard(key[0])
+    
+    def _tick(self):
+        """Advance every running animation to the current time."""
+        self._tick_root = self._tick_after_id = None
+        now = time.monotonic()
+        
+        for key, animation in list(self._animations.items()):
+            widget_id, morph = key
+            running = self._running(morph)
+            if widget_id not in running:
+                # Stopped since the last tick
+                del self._animations[key]
+                continue
+            
+            progress = min(1.0, (now - animation.start) / animation.duration)
+            try:
+                animation.apply(animation.curve[int(progress * EASING_STEPS + 0.5)])
+            except tk.TclError:
+                progress = None  # Widget destroyed mid-animation
+            
+            if progress is None or progress >= 1.0:
+                del self._animations[key]
+                running.discard(widget_id)
+                if progress is not None and animation.callback:
+                    animation.callback()
+        
+        if self._animations:
+            self._ensure_tick()
         
     def fade_in(self, widget: tk.Widget, duration: int = 300, callback: Optional[Callable] = None):
         """Fade in animation for widgets."""
-        animation_id = id(widget)
-        steps = 20
-        step_duration = duration // steps
-        
-        def animate_step(step: int):
-            if animation_id not in self.running_animations:
-                return
-                
-            progress = step / steps
-            alpha = int(255 * self.theme.easing['ease_out'](progress))
-            
+        def apply(eased_progress: float):
+            alpha = int(255 * eased_progress)
             # Apply alpha to widget (simplified - would need more complex implementation)
-            if step < steps:
-                widget.after(step_duration, lambda: animate_step(step + 1))
-            else:
-                del self.running_animations[animation_id]
-                if callback:
-                    callback()
         
-        self.running_animations[animation_id] = True
-        animate_step(0)
+        self._start(widget, duration, 'ease_out', apply, callback)
     
     def slide_in(self, widget: tk.Widget, direction: str = "up", duration: int = 400, 
                  callback: Optional[Callable] = None):
         """Slide in animation for widgets."""
-        animation_id = id(widget)
-        steps = 30
-        step_duration = duration // steps
-        
         # Store original position
         original_x = widget.winfo_x()
         original_y = widget.winfo_y()
@@ -523,64 +771,48 @@ class AnimationManager:
             start_offset = -50
             widget.place(x=original_x + start_offset, y=original_y)
         
-        def animate_step(step: int):
-            if animation_id not in self.running_animations:
-                return
-                
-            progress = step / steps
-            eased_progress = self.theme.easing['ease_out'](progress)
-            
-            if direction in ["up", "down"]:
-                current_y = original_y + start_offset * (1 - eased_progress)
-                widget.place(x=original_x, y=current_y)
-            else:
-                current_x = original_x + start_offset * (1 - eased_progress)
-                widget.place(x=current_x, y=original_y)
-            
-            if step < steps:
-                widget.after(step_duration, lambda: animate_step(step + 1))
-            else:
-                widget.place(x=original_x, y=original_y)
-                del self.running_animations[animation_id]
-                if callback:
-                    callback()
+        # Only the sliding axis changes, and only whole-pixel moves are sent
+        if direction in ["up", "down"]:
+            axis, origin = 'y', original_y
+        else:
+            axis, origin = 'x', original_x
+        last_position = origin + start_offset
+        
+        def apply(eased_progress: float):
+            nonlocal last_position
+            position = origin + round(start_offset * (1 - eased_progress))
+            if position != last_position:
+                last_position = position
+                widget.place_configure(**{axis: position})
         
-        self.running_animations[animation_id] = True
-        animate_step(0)
+        self._start(widget, duration, 'ease_out', apply, callback)
     
     def morphing_transition(self, widget: tk.Widget, target_bg: str, duration: int = 200):
         """Smooth color morphing transition."""
-        animation_id = f"{id(widget)}_morph"
-        steps = 15
-        step_duration = duration // steps
-        
-        # Get current background (simplified)
-        current_bg = widget.cget('bg')
-        
-        def animate_step(step: int):
-            if animation_id not in self.running_animations:
-                return
-                
-            progress = step / steps
-            eased_progress = self.theme.easing['ease_in_out'](progress)
-            
-            # For now, just set the target color (real implementation would interpolate)
-            if step >= steps // 2:
+        # Resolve both ends once; frames only do integer blending
+        start_rgb = _color_to_int(widget, widget.cget('bg'))
+        target_rgb = _color_to_int(widget, target_bg)
+        last_rgb = start_rgb
+        
+        def apply(eased_progress: float):
+            nonlocal last_rgb
+            if eased_progress >= 1.0:
                 widget.configure(bg=target_bg)
+                return
             
-            if step < steps:
-                widget.after(step_duration, lambda: animate_step(step + 1))
-            else:
-                del self.running_animations[animation_id]
+            rgb = _blend_rgb(start_rgb, target_rgb, int(eased_progress * 255 + 0.5))
+            if rgb != last_rgb:
+                last_rgb = rgb
+                widget.configure(bg='#%06X' % rgb)
         
-        self.running_animations[animation_id] = True
-        animate_step(0)
+        self._start(widget, duration, 'ease_in_out', apply, morph=True)
     
     def stop_animation(self, widget: tk.Widget):
         """Stop any running animation for a widget."""
         animation_id = id(widget)
         if animation_id in self.running_animations:
-            del self.running_animations[animation_id]
+            self.running_animations.discard(animation_id)
+            self._animations.pop((animation_id, False), None)
 
 
 class GlassmorphismWindow:
@@ -629,7 +861,7 @@ class GlassmorphismWindow:
         # This would require platform-specific implementations or libraries like Pillow
         overlay = tk.Frame(
             widget,
-            bg=self.theme.colors.glass_primary + self.theme.colors.alpha_30,
+            bg=self.theme.colors.blended('glass_primary', 'alpha_30'),
             relief='flat',
             bd=0
         )
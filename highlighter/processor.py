@@ -1,4 +1,5 @@
 import os
+import functools
 import librosa
 import numpy as np
 import subprocess
@@ -71,6 +72,52 @@ def extract_audio_from_video(video_path: str, output_path: str):
         raise RuntimeError(error_msg)
     
 
+@functools.lru_cache(maxsize=8)
+def get_keyframe_times(video_path: str, intervals: Optional[Tuple[Tuple[float, float], ...]] = None) -> np.ndarray:
+    """Get the sorted keyframe timestamps of a video's first video stream.
+
+    Only packet headers are read, so no frames are decoded. Results are cached
+    per path and intervals since every clip cut from the same video snaps to
+    the same GOPs.
+
+    Args:
+        video_path (str): path to the video file
+        intervals (tuple, optional): (start, end) ranges in seconds to probe
+            instead of the whole file. Each read starts at the keyframe at or
+            before its start.
+
+    Returns:
+        np.ndarray: keyframe times in seconds, empty if they could not be probed
+    """
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0'
+    ]
+    if intervals:
+        cmd += ['-read_intervals', ','.join(f'{start}%{end}' for start, end in intervals)]
+    cmd.append(video_path)
+    
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, check=True,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.warning(f'could not probe keyframes for {video_path}: {e}')
+        return np.empty(0)
+    
+    times = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            times.append(float(pts_time))
+    
+    logger.debug(f'found {len(times)} keyframes in {video_path}')
+    return np.unique(np.asarray(times, dtype=np.float64))
+    
+
 class StreamingAudioProcessor:
     """Memory-efficient audio processor that streams chunks instead of loading entire file."""
     
@@ -144,6 +191,31 @@ class StreamingAudioProcessor:
                     segment_offset = offset + (i * len(chunk) / len(segments)) / self.sample_rate
                     yield [decibels[i]], segment_offset
     
+    def decibel_blocks(self, block: int = 64) -> Generator[Tuple[np.ndarray, np.ndarray, np.ndarray], None, None]:
+        """Iterate over decibel readings in fixed-size NumPy blocks.
+        
+        Each reading covers a single segment, so its peak and average are the
+        same value; both arrays are yielded to keep the analyzer agnostic of that.
+        
+        Args:
+            block (int): maximum number of readings per yielded block.
+        
+        Yields:
+            tuple: (max_db, avg_db, positions) arrays of equal length.
+        """
+        for chunk, offset in self.stream_chunks():
+            if chunk.size == 0:
+                continue
+            
+            segments = np.array_split(chunk, SPLIT_FRAMES)
+            decibels = np.asarray(self._into_decibels(segments), dtype=np.float64)
+            # Same operation order as decibel_iter so positions round identically
+            positions = offset + (np.arange(len(segments)) * len(chunk) / len(segments)) / self.sample_rate
+            
+            for start in range(0, len(decibels), block):
+                block_db = decibels[start:start + block]
+                yield block_db, block_db, positions[start:start + block]
+    
     def _into_decibels(self, segments):
         """Convert audio segments into decibels."""
         decibels = []
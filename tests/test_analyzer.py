@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Tests for highlight detection and clip range planning in the analyzer.
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add project to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from highlighter import processor
+from highlighter.analyzer import StreamingAudioAnalysis, _coalesce_clip_ranges, _keyframe_intervals
+
+
+class SyntheticAudioProcessor(processor.StreamingAudioProcessor):
+    """Streaming processor fed from an in-memory signal instead of a file."""
+
+    def __init__(self, signal, sample_rate, chunk_duration):
+        self.audio_path = '<synthetic>'
+        self.chunk_duration = chunk_duration
+        self.sample_rate = sample_rate
+        self.duration = len(signal) / sample_rate
+        self.chunk_samples = int(chunk_duration * sample_rate)
+        self._signal = signal
+
+    def stream_chunks(self):
+        for start in range(0, len(self._signal), self.chunk_samples):
+            yield self._signal[start:start + self.chunk_samples], start / self.sample_rate
+
+
+def make_signal(seed, seconds=600, sample_rate=2000):
+    """Build quiet noise with bursts of varying loudness and length, plus silent gaps."""
+    rng = np.random.default_rng(seed)
+    segment = 20
+    n_segments = seconds * sample_rate // segment
+    amplitude = np.full(n_segments, 0.05)
+
+    for start in rng.integers(0, n_segments, size=400):
+        level = rng.choice([0.0, 0.3, 0.56, 0.6, 0.8, 1.0, 1.5, 3.5])
+        amplitude[start:start + rng.integers(1, 8)] = level
+
+    signal = rng.standard_normal(n_segments * segment) * np.repeat(amplitude, segment)
+    # Leave a partial last chunk so uneven segment splits are covered too
+    return signal[:-segment * 37], sample_rate
+
+
+def baseline_highlights(audio_processor, threshold, min_gap=40):
+    """Reference implementation of the original per-reading detection loop."""
+    captured = {}
+    rolling_window = []
+
+    for decibel_data, position in audio_processor.decibel_iter():
+        max_decibel = max(decibel_data)
+        avg_decibel = sum(decibel_data) / len(decibel_data)
+        rolling_window.append((max_decibel, avg_decibel))
+        if len(rolling_window) > 5:
+            rolling_window.pop(0)
+
+        if max_decibel < threshold:
+            continue
+        if any(abs(existing - int(position)) < min_gap for existing in captured):
+            continue
+
+        sustained_count = sum(1 for m, _ in rolling_window if m >= threshold)
+        if sustained_count >= 3 or max_decibel >= threshold + 3:
+            captured[int(position)] = max_decibel
+        elif len(rolling_window) >= 3:
+            rolling_avg = sum(a for _, a in rolling_window) / len(rolling_window)
+            if max_decibel >= rolling_avg + 6:
+                captured[int(position)] = max_decibel
+
+    return captured
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+@pytest.mark.parametrize("threshold", [-5.0, -20.0, 10.0])
+def test_streaming_detection_matches_baseline(tmp_path, seed, threshold):
+    """
+    Tests that the block-based detector captures the same positions and
+    decibels as the original per-reading loop.
+    """
+    signal, sample_rate = make_signal(seed)
+    audio = SyntheticAudioProcessor(signal, sample_rate, chunk_duration=10.0)
+
+    analysis = StreamingAudioAnalysis('<synthetic>', audio, str(tmp_path), decibel_threshold=threshold)
+    analysis.streaming_crest_ceiling_algorithm()
+
+    expected = baseline_highlights(audio, threshold)
+    actual = {position: moment.decibel for position, moment in analysis._captured_result.items()}
+
+    assert expected, "synthetic signal should produce highlights"
+    assert actual == expected
+
+
+def test_decibel_blocks_match_decibel_iter():
+    """
+    Tests that decibel_blocks yields the same readings and positions as decibel_iter.
+    """
+    signal, sample_rate = make_signal(3, seconds=60)
+    audio = SyntheticAudioProcessor(signal, sample_rate, chunk_duration=10.0)
+
+    readings = [(decibels[0], position) for decibels, position in audio.decibel_iter()]
+    blocks = [
+        (float(db), float(position))
+        for max_db, _, positions in audio.decibel_blocks(64)
+        for db, position in zip(max_db, positions)
+    ]
+
+    assert blocks == readings
+
+
+def test_coalesce_clip_ranges_without_keyframes():
+    """
+    Tests that without keyframes ranges are only merged when they overlap.
+    """
+    ranges = _coalesce_clip_ranges({10: None, 100: None, 120: None}, np.empty(0), 20, 20)
+
+    assert ranges == {10: (0.0, 30.0), 100: (80.0, 140.0)}
+
+
+def test_coalesce_clip_ranges_snaps_to_keyframes():
+    """
+    Tests that starts snap back and ends snap forward to the nearest keyframe.
+    """
+    keyframes = np.arange(0.0, 300.0, 10.0)
+    ranges = _coalesce_clip_ranges({45: None, 203: None}, keyframes, 20, 20)
+
+    assert ranges == {45: (20.0, 70.0), 203: (180.0, 230.0)}
+
+
+def test_coalesce_clip_ranges_merges_ranges_sharing_a_gop():
+    """
+    Tests that highlights whose snapped ranges overlap become one clip, while
+    ranges that only touch stay separate.
+    """
+    keyframes = np.arange(0.0, 300.0, 10.0)
+
+    assert _coalesce_clip_ranges({85: None, 45: None}, keyframes, 20, 20) == {45: (20.0, 110.0)}
+    assert _coalesce_clip_ranges({45: None, 90: None}, keyframes, 20, 20) == {45: (20.0, 70.0), 90: (70.0, 110.0)}
+
+
+def test_coalesce_clip_ranges_limits_end_snap():
+    """
+    Tests that ends are not extended to keyframes beyond the probed margin.
+    """
+    keyframes = np.array([0.0, 100.0])
+
+    assert _coalesce_clip_ranges({30: None}, keyframes, 20, 20) == {30: (0.0, 50.0)}
+    assert _coalesce_clip_ranges({30: None}, keyframes, 20, 20, max_end_snap=60) == {30: (0.0, 100.0)}
+
+
+def test_keyframe_intervals_cover_each_clip():
+    """
+    Tests that the probed intervals start at each clip start and extend past its end.
+    """
+    assert _keyframe_intervals({45: None, 10: None}, 20, 20) == ((0, 40), (25, 75))
+
+
+def test_concurrent_generators_keep_separate_progress(tmp_path, monkeypatch):
+    """
+    Tests that two clip generators running at once each drive their own
+    animation, so one finishing does not stop or overwrite the other.
+    """
+    import threading
+    from highlighter.analyzer import OptimizedClipGenerator
+
+    first_done = threading.Event()
+    second_started = threading.Event()
+
+    def fake_clip(self, video_path, position, *args):
+        # The second job's clips only finish after the first job is done
+        if video_path == 'second':
+            second_started.set()
+            first_done.wait(timeout=10)
+        return True
+
+    monkeypatch.setattr(OptimizedClipGenerator, '_generate_single_clip', fake_clip)
+
+    first = OptimizedClipGenerator(max_workers=2)
+    second = OptimizedClipGenerator(max_workers=2)
+    assert first._animation is not second._animation
+
+    results = {}
+
+    def run_second():
+        highlights = {position * 60: None for position in range(12)}
+        results['second'] = second.generate_clips_parallel(highlights, 'second', str(tmp_path), 20, 20)
+
+    thread = threading.Thread(target=run_second)
+    thread.start()
+    assert second_started.wait(timeout=10)
+
+    results['first'] = first.generate_clips_parallel({0: None, 60: None, 120: None}, 'first', str(tmp_path), 20, 20)
+
+    # The first job finishing leaves the second job's animation running untouched
+    assert second._animation._is_running
+    assert second._animation._total_items == 12
+
+    first_done.set()
+    thread.join(timeout=30)
+
+    assert results == {'first': (3, 0), 'second': (12, 0)}
+    for generator, count in ((first, 3), (second, 12)):
+        assert generator._animation._total_items == count
+        assert generator._animation._completed_items == count
+        assert not generator._animation._is_running
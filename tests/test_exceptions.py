@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the error context built from exceptions.
+"""
+
+import sys
+import os
+import dataclasses
+
+# Add project to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from highlighter.core.exceptions import (
+    ErrorCategory,
+    ErrorContext,
+    ErrorSeverity,
+    ValidationError,
+    create_error_context
+)
+
+
+def make_context(**kwargs):
+    """Build a minimal error context."""
+    return ErrorContext("e1", ErrorCategory.INTERNAL, ErrorSeverity.LOW, "message", "user message", **kwargs)
+
+
+def test_technical_details_constructor_keyword_and_setter():
+    """
+    Tests that technical_details can still be passed to the constructor and assigned.
+    """
+    context = make_context(technical_details="explicit")
+    assert context.technical_details == "explicit"
+    assert dataclasses.replace(context, message="other").technical_details == "explicit"
+
+    context.technical_details = "updated"
+    assert context.technical_details == "updated"
+    assert context.details == "updated"
+
+    assert make_context().technical_details is None
+
+
+def test_technical_details_format_traceback_lazily():
+    """
+    Tests that a wrapped exception's traceback is formatted only when first read.
+    """
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        context = create_error_context(e)
+
+    assert context.details is None
+    details = context.technical_details
+    assert details.rstrip().endswith("ZeroDivisionError: division by zero")
+    assert context.details is details
+
+
+def test_clipper_exception_details_carry_over():
+    """
+    Tests that details given to an M0 Clipper exception reach its context.
+    """
+    context = create_error_context(ValidationError("bad value", technical_details="value was -1"))
+
+    assert context.technical_details == "value was -1"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for input validation and its memoized checks.
+"""
+
+import sys
+import os
+import pytest
+
+# Add project to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from highlighter.core.exceptions import FileSystemError, ValidationError
+from highlighter.core.validation import validate_video_input, validate_analysis_parameters
+
+
+def test_deleted_video_fails_validation(tmp_path):
+    """
+    Tests that a video validated once is rejected after it is deleted.
+    """
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\0" * 16)
+
+    assert validate_video_input(str(video)) == video
+    assert validate_video_input(video) == video
+
+    video.unlink()
+
+    with pytest.raises(FileSystemError):
+        validate_video_input(str(video))
+    with pytest.raises(FileSystemError):
+        validate_video_input(video)
+
+
+def test_renamed_video_fails_validation_under_old_name(tmp_path):
+    """
+    Tests that only the new name of a renamed video still validates.
+    """
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\0" * 16)
+    validate_video_input(str(video))
+
+    renamed = video.rename(tmp_path / "renamed.mp4")
+
+    with pytest.raises(FileSystemError):
+        validate_video_input(str(video))
+    assert validate_video_input(str(renamed)) == renamed
+
+
+def test_video_replaced_by_directory_fails_validation(tmp_path):
+    """
+    Tests that a validated video replaced by a directory of the same name is rejected.
+    """
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\0" * 16)
+    validate_video_input(str(video))
+
+    video.unlink()
+    video.mkdir()
+
+    with pytest.raises(FileSystemError):
+        validate_video_input(str(video))
+
+
+@pytest.mark.parametrize("params", [
+    {"decibel_threshold": [-5], "clip_length": 30},
+    {"decibel_threshold": -5, "clip_length": {"seconds": 30}},
+    {"decibel_threshold": -5, "clip_length": 30, "workers": [4]},
+])
+def test_unhashable_analysis_parameters_raise_validation_error(params):
+    """
+    Tests that unhashable parameters are rejected like any other invalid value.
+    """
+    with pytest.raises(ValidationError):
+        validate_analysis_parameters(**params)
+
+
+def test_analysis_parameters_return_fresh_dicts():
+    """
+    Tests that memoized parameter sets still hand each caller its own dict.
+    """
+    first = validate_analysis_parameters(-5, 30, workers=2)
+    first['clip_length'] = 0
+
+    assert validate_analysis_parameters(-5, 30, workers=2)['clip_length'] == 30